@@ -9,8 +9,55 @@ import py_compile
 import shutil
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Files above this size (videos, audio) are copied with the platform fast path
+LARGE_FILE_THRESHOLD = 8 * 1024 * 1024
+
+# Copy jobs are I/O-bound, so more threads than cores is fine
+COPY_WORKERS = 16
+
+
+def _fast_copy(src, dst):
+    """Copy a file with metadata, cloning large files on macOS (APFS clonefile)."""
+    st = os.stat(src)
+    if sys.platform == 'darwin' and st.st_size > LARGE_FILE_THRESHOLD:
+        try:
+            subprocess.run(['cp', '-c', str(src), str(dst)], check=True)
+            return dst
+        except (OSError, subprocess.CalledProcessError):
+            pass  # Fall back to a regular copy (e.g. non-APFS volume)
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _compile_file(src, dst):
+    """Compile one source file to bytecode (runs in a worker process).
+    
+    Returns (src, error message), with None for the message on success.
+    PyCompileError can't be pickled back to the parent, so it never leaves
+    the worker.
+    """
+    try:
+        py_compile.compile(src, dst, doraise=True)
+    except py_compile.PyCompileError as e:
+        return src, str(e)
+    return src, None
+
+
+def _write_if_changed(path, content):
+    """Write content to path only if it differs; return True if written."""
+    try:
+        if path.read_text() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_text(content)
+    return True
+
+
 def compile_project():
     """Compile all Python files except config.py for deployment."""
     
@@ -18,11 +65,19 @@ def compile_project():
     project_root = Path(__file__).parent
     src_dir = project_root / "src"
     
-    # Create deployment directory
+    # Create deployment directory. Generated launcher files are kept so they
+    # are only rewritten (and the .app only rebuilt) when their content changes.
     deploy_dir = project_root / "deploy"
+    generated_files = {"run_mellowmind_compiled.py", "MellowMind.scpt"}
     if deploy_dir.exists():
-        shutil.rmtree(deploy_dir)
-    deploy_dir.mkdir()
+        for item in deploy_dir.iterdir():
+            if item.name in generated_files:
+                continue
+            if item.is_dir():
+                shutil.rmtree(item)
+            else:
+                item.unlink()
+    deploy_dir.mkdir(exist_ok=True)
     
     # Files/directories to exclude from compilation
     exclude_files = {"config.py"}
@@ -36,58 +91,78 @@ def compile_project():
     compiled_count = 0
     copied_count = 0
     
-    # Copy non-Python files and directories first
-    for item in project_root.iterdir():
-        if item.name in exclude_dirs or item.name == "deploy":
-            continue
-            
-        if item.is_file() and not item.name.endswith('.py'):
-            shutil.copy2(item, deploy_dir / item.name)
-            copied_count += 1
-        elif item.is_dir() and item.name not in exclude_dirs:
-            if item.name == "src":
-                continue  # Handle src separately
-            shutil.copytree(item, deploy_dir / item.name)
-            copied_count += 1
-    
-    # Create src directory in deployment
-    deploy_src = deploy_dir / "src"
-    deploy_src.mkdir()
-    
-    # Process src directory
-    for root, dirs, files in os.walk(src_dir):
-        # Skip __pycache__ directories
-        dirs[:] = [d for d in dirs if d != "__pycache__"]
+    # Compiling is CPU-bound and copying is I/O-bound, so the walkers below only
+    # submit work: compiles go to a process pool, copies to a thread pool, and
+    # both run concurrently.
+    copy_futures = {}
+    compile_futures = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as compile_pool, \
+            ThreadPoolExecutor(max_workers=COPY_WORKERS) as copy_pool:
         
-        # Get relative path for deployment structure
-        rel_path = Path(root).relative_to(src_dir)
-        deploy_root = deploy_src / rel_path
-        deploy_root.mkdir(parents=True, exist_ok=True)
+        # Copy non-Python files and directories first
+        for item in project_root.iterdir():
+            if item.name in exclude_dirs or item.name == "deploy":
+                continue
+                
+            if item.is_file() and not item.name.endswith('.py'):
+                future = copy_pool.submit(_fast_copy, item, deploy_dir / item.name)
+                copy_futures[future] = None
+            elif item.is_dir() and item.name not in exclude_dirs:
+                if item.name == "src":
+                    continue  # Handle src separately
+                future = copy_pool.submit(shutil.copytree, item, deploy_dir / item.name,
+                                          copy_function=_fast_copy)
+                copy_futures[future] = None
         
-        for file in files:
-            if file.endswith('.py'):
+        # Create src directory in deployment
+        deploy_src = deploy_dir / "src"
+        deploy_src.mkdir()
+        
+        # Process src directory
+        for root, dirs, files in os.walk(src_dir):
+            # Skip __pycache__ directories
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            
+            # Get relative path for deployment structure. Directories are created
+            # here, before any work is submitted, so workers never race on mkdir.
+            rel_path = Path(root).relative_to(src_dir)
+            deploy_root = deploy_src / rel_path
+            deploy_root.mkdir(parents=True, exist_ok=True)
+            
+            for file in files:
                 file_path = Path(root) / file
-                
-                if file in exclude_files:
-                    # Copy config.py as-is (editable)
-                    shutil.copy2(file_path, deploy_root / file)
-                    print(f"📄 Copied (editable): {file_path.relative_to(project_root)}")
-                    copied_count += 1
-                else:
-                    # Compile Python file to bytecode
-                    try:
-                        # Compile to .pyc in deployment directory
+                if file.endswith('.py'):
+                    if file in exclude_files:
+                        # Copy config.py as-is (editable)
+                        future = copy_pool.submit(shutil.copy2, file_path, deploy_root / file)
+                        copy_futures[future] = f"📄 Copied (editable): {file_path.relative_to(project_root)}"
+                    else:
+                        # Compile Python file to bytecode in deployment directory
                         compiled_path = deploy_root / f"{file_path.stem}.pyc"
-                        py_compile.compile(file_path, compiled_path, doraise=True)
-                        print(f"🔧 Compiled: {file_path.relative_to(project_root)} -> {compiled_path.relative_to(project_root)}")
-                        compiled_count += 1
-                    except py_compile.PyCompileError as e:
-                        print(f"❌ Failed to compile {file_path}: {e}")
-                        return False
-            else:
-                # Copy non-Python files as-is
-                shutil.copy2(Path(root) / file, deploy_root / file)
-                copied_count += 1
+                        future = compile_pool.submit(_compile_file, str(file_path), str(compiled_path))
+                        compile_futures[future] = (file_path, compiled_path)
+                else:
+                    # Copy non-Python files as-is
+                    future = copy_pool.submit(shutil.copy2, file_path, deploy_root / file)
+                    copy_futures[future] = None
+        
+        for future in as_completed(compile_futures):
+            file_path, compiled_path = compile_futures[future]
+            _, error = future.result()
+            if error is not None:
+                print(f"❌ Failed to compile {file_path}: {error}")
+                for pending in list(compile_futures) + list(copy_futures):
+                    pending.cancel()
+                return False
+            print(f"🔧 Compiled: {file_path.relative_to(project_root)} -> {compiled_path.relative_to(project_root)}")
+            compiled_count += 1
+        
+        for future in as_completed(copy_futures):
+            future.result()
+            message = copy_futures[future]
+            if message:
+                print(message)
+            copied_count += 1
     
     # Create a deployment runner script
     runner_script = deploy_dir / "run_mellowmind_compiled.py"
@@ -119,8 +194,7 @@ except Exception as e:
     sys.exit(1)
 '''
     
-    with open(runner_script, 'w') as f:
-        f.write(runner_content)
+    _write_if_changed(runner_script, runner_content)
     
     # Make runner script executable
     os.chmod(runner_script, 0o755)
@@ -135,6 +209,7 @@ except Exception as e:
     print(f"📁 Deployment ready in: {deploy_dir}")
     print(f"🚀 Run with: python3 {runner_script.relative_to(project_root)}")
     print(f"⚙️  Config file remains editable at: {deploy_dir}/src/config.py")
+    print("   (config.py ships as source, so edits are picked up on next launch)")
     
     return True
 
@@ -165,16 +240,19 @@ end run'''
     
     # Create AppleScript file in deploy directory
     applescript_file = deploy_dir / "MellowMind.scpt"
-    with open(applescript_file, 'w') as f:
-        f.write(applescript_content)
-    
-    print(f"📝 Created AppleScript: {applescript_file}")
+    script_changed = _write_if_changed(applescript_file, applescript_content)
     
     # Determine desktop path
     desktop_path = f"/Users/{current_user}/Desktop"
     app_name = "MellowMind.app"
     app_path = f"{desktop_path}/{app_name}"
     
+    if not script_changed and Path(app_path).exists():
+        print(f"📝 AppleScript unchanged, keeping existing application: {app_path}")
+        return True
+    
+    print(f"📝 Created AppleScript: {applescript_file}")
+    
     try:
         # Create .app bundle using osacompile
         cmd = [
@@ -6,17 +6,15 @@ from PyQt6.QtGui import QKeySequence, QShortcut, QFont
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QStackedWidget, QLabel, QPushButton, QHBoxLayout
 from PyQt6.QtWebEngineWidgets import QWebEngineView  # Import early for proper initialization
 import threading
-import time
 import os
 import signal
 import atexit
-import json
-from datetime import datetime, timezone
+from contextlib import contextmanager
 
 
 # Import configuration and managers
 from config import *
-from logging_manager import LoggingManager
+from logging_manager import LoggingManager, dprint
 from recovery_manager import RecoveryManager
 from video_manager import VideoManager
 from countdown_manager import CountdownManager
@@ -147,12 +145,47 @@ Would you like to resume where you left off, or start a new session?"""
         self.app.handle_recovery_choice("new", self.recovery_data)
 
 
+def _lazy_screen(name):
+    """App attribute that builds the named screen on first access."""
+    return property(lambda self: self._get_screen(name))
+
+
 class MolyApp(QMainWindow):
     """
     Unified Moly relaxation application with modular screen architecture.
     Handles transitions between relaxation, descriptive tasks, and video screens.
     """
     
+    # Modular screens, built by _get_screen the first time they are used
+    participant_id_screen = _lazy_screen('participant_id')
+    prestudy_screen = _lazy_screen('prestudy')
+    duringstudy1_screen = _lazy_screen('duringstudy1')
+    duringstudy2_screen = _lazy_screen('duringstudy2')
+    poststudy_screen = _lazy_screen('poststudy')
+    consent_screen = _lazy_screen('consent')
+    relaxation_screen = _lazy_screen('relaxation')
+    descriptive_task_screen = _lazy_screen('descriptive_task')
+    stroop_screen = _lazy_screen('stroop')
+    math_screen = _lazy_screen('math_task')
+    content_performance_screen = _lazy_screen('content_performance')
+    post_study_rest_screen = _lazy_screen('post_study_rest')
+    descriptive_transition_screen = _lazy_screen('descriptive_transition')
+    stroop_transition_screen = _lazy_screen('stroop_transition')
+    math_transition_screen = _lazy_screen('math_transition')
+    content_performance_transition_screen = _lazy_screen('content_performance_transition')
+    relaxation_transition_screen = _lazy_screen('relaxation_transition')
+    
+    @property
+    def current_screen(self):
+        """Name of the screen being shown."""
+        return self._current_screen
+    
+    @current_screen.setter
+    def current_screen(self, screen_name):
+        self._current_screen = screen_name
+        # Encoded here, since the crash handler can't run the JSON encoder
+        self.logging_manager.set_crash_screen(screen_name)
+    
     def __init__(self):
         super().__init__()
         self.app = QApplication.instance()
@@ -185,15 +218,42 @@ class MolyApp(QMainWindow):
         main_layout.addWidget(self.stacked_widget)
         
         # Common properties
+        self._screen_factories = None  # Screen name -> constructor, set by initialize_screens
+        self.screens = {}  # Screens built so far, by name
         self.current_screen_widget = None
-        self.current_screen = "participant_id"
+        self._current_screen = "participant_id"
+        self._pending_screen = None  # Latest switch_to_screen target not yet shown
+        self._switch_scheduled = False
         self.running = True
         
         # Participant tracking
         self.participant_id = None
+        self._exit_logged = False
+        
+        # App-level key shortcuts registered by screens (released in clear_screen)
+        self.shortcuts = []
+        self.corner_countdown_label = None
+        
+        # Recovery state screen names -> switch methods used by resume_session
+        self._resume_dispatch = {
+            'relaxation': self.switch_to_relaxation,
+            'stroop': self.switch_to_stroop,
+            'math_task': self.switch_to_math_task,
+            'post_study_rest': self.switch_to_post_study_rest,
+            'content_performance': self.switch_to_content_performance,
+            'consent': self.switch_to_consent,
+            'prestudy': self.switch_to_prestudy_survey,
+            'duringstudy1': self.switch_to_duringstudy1_survey,
+            'duringstudy2': self.switch_to_duringstudy2_survey,
+            'poststudy': self.switch_to_poststudy_survey,
+            'descriptive_transition': self.switch_to_descriptive_transition,
+            'stroop_transition': self.switch_to_stroop_transition,
+            'math_transition': self.switch_to_math_transition
+        }
         
         # Initialize managers
         self.logging_manager = LoggingManager()
+        self.logging_manager.set_crash_screen(self._current_screen)
         self.recovery_manager = RecoveryManager(self.logging_manager)
         self.video_manager = VideoManager()
         self.countdown_manager = CountdownManager(self.logging_manager)
@@ -210,7 +270,7 @@ class MolyApp(QMainWindow):
         
         # Descriptive task properties (for compatibility)
         self.current_prompt_index = 0
-        self.prompts = DESCRIPTIVE_PROMPTS.copy()
+        self.prompts = DESCRIPTIVE_PROMPTS  # Read-only, shared with config
         
         # Math task properties (for compatibility)
         self.current_number = MATH_STARTING_NUMBER
@@ -236,53 +296,41 @@ class MolyApp(QMainWindow):
         self.check_and_handle_recovery()
 
     def initialize_screens(self):
-        """Initialize all modular screens."""
-        self.participant_id_screen = ParticipantIDScreen(self, self.logging_manager)
-        self.prestudy_screen = WebpageScreen(self, self.logging_manager, 'prestudy')  # Default survey screen
-        self.duringstudy1_screen = WebpageScreen(self, self.logging_manager, 'duringstudy1')
-        self.duringstudy2_screen = WebpageScreen(self, self.logging_manager, 'duringstudy2')
-        self.poststudy_screen = WebpageScreen(self, self.logging_manager, 'poststudy')
-        self.consent_screen = ConsentScreen(self, self.logging_manager)
-        self.relaxation_screen = RelaxationScreen(self, self.logging_manager)
-        self.descriptive_task_screen = DescriptiveTaskScreen(self, self.logging_manager)
+        """Register the modular screens; each is constructed on first use."""
+        logging_manager = self.logging_manager
         
         # Choose Stroop screen type based on configuration
-        if GENERATE_STROOP_NATIVE:
-            self.stroop_screen = NativeStroopScreen(self, self.logging_manager)
-        else:
-            self.stroop_screen = StroopScreen(self, self.logging_manager)
+        stroop_class = NativeStroopScreen if GENERATE_STROOP_NATIVE else StroopScreen
+        
+        self._screen_factories = {
+            'participant_id': lambda: ParticipantIDScreen(self, logging_manager),
+            'prestudy': lambda: WebpageScreen(self, logging_manager, 'prestudy'),  # Default survey screen
+            'duringstudy1': lambda: WebpageScreen(self, logging_manager, 'duringstudy1'),
+            'duringstudy2': lambda: WebpageScreen(self, logging_manager, 'duringstudy2'),
+            'poststudy': lambda: WebpageScreen(self, logging_manager, 'poststudy'),
+            'consent': lambda: ConsentScreen(self, logging_manager),
+            'relaxation': lambda: RelaxationScreen(self, logging_manager),
+            'descriptive_task': lambda: DescriptiveTaskScreen(self, logging_manager),
+            'stroop': lambda: stroop_class(self, logging_manager),
+            'math_task': lambda: MathTaskScreen(self, logging_manager),
+            'content_performance': lambda: ContentPerformanceScreen(self, logging_manager),
+            'post_study_rest': lambda: PostStudyRestScreen(self, logging_manager),
             
-        self.math_screen = MathTaskScreen(self, self.logging_manager)
-        self.content_performance_screen = ContentPerformanceScreen(self, self.logging_manager)
-        self.post_study_rest_screen = PostStudyRestScreen(self, self.logging_manager)
-        
-        # Initialize transition screens
-        self.descriptive_transition_screen = TransitionScreen(self, self.logging_manager, 'descriptive', self.switch_to_descriptive_task)
-        self.stroop_transition_screen = TransitionScreen(self, self.logging_manager, 'stroop', self.switch_to_stroop)
-        self.math_transition_screen = TransitionScreen(self, self.logging_manager, 'math', self.switch_to_math_task)
-        self.content_performance_transition_screen = TransitionScreen(self, self.logging_manager, 'content_performance', self.switch_to_content_performance)
-        self.relaxation_transition_screen = TransitionScreen(self, self.logging_manager, 'post_study_rest', self.switch_to_post_study_rest)
-        
-        # Store all screens for easy access
-        self.screens = {
-            'participant_id': self.participant_id_screen,
-            'prestudy': self.prestudy_screen,
-            'duringstudy1': self.duringstudy1_screen,
-            'duringstudy2': self.duringstudy2_screen,
-            'poststudy': self.poststudy_screen,
-            'consent': self.consent_screen,
-            'relaxation': self.relaxation_screen,
-            'descriptive_task': self.descriptive_task_screen,
-            'descriptive_transition': self.descriptive_transition_screen,
-            'stroop': self.stroop_screen,
-            'stroop_transition': self.stroop_transition_screen,
-            'math_task': self.math_screen,
-            'math_transition': self.math_transition_screen,
-            'content_performance': self.content_performance_screen,
-            'content_performance_transition': self.content_performance_transition_screen,
-            'post_study_rest': self.post_study_rest_screen,
-            'relaxation_transition': self.relaxation_transition_screen
+            # Transition screens
+            'descriptive_transition': lambda: TransitionScreen(self, logging_manager, 'descriptive', self.switch_to_descriptive_task),
+            'stroop_transition': lambda: TransitionScreen(self, logging_manager, 'stroop', self.switch_to_stroop),
+            'math_transition': lambda: TransitionScreen(self, logging_manager, 'math', self.switch_to_math_task),
+            'content_performance_transition': lambda: TransitionScreen(self, logging_manager, 'content_performance', self.switch_to_content_performance),
+            'relaxation_transition': lambda: TransitionScreen(self, logging_manager, 'post_study_rest', self.switch_to_post_study_rest),
         }
+    
+    def _get_screen(self, name):
+        """Return the named screen, constructing it and adding it to the stack on first use."""
+        screen = self.screens.get(name)
+        if screen is None:
+            screen = self.screens[name] = self._screen_factories[name]()
+            self.stacked_widget.addWidget(screen)
+        return screen
 
     def setup_crash_detection(self):
         """Set up crash detection and logging."""
@@ -296,44 +344,22 @@ class MolyApp(QMainWindow):
         atexit.register(self.handle_app_exit)
 
     def handle_crash(self, signum, frame):
-        """Handle application crash."""
-        print(f"💥 Application crash detected (signal {signum})")
-
-        # Log the crash if logging is set up
-        if hasattr(self.logging_manager, 'action_log_file_path') and self.logging_manager.action_log_file_path:
-            try:
-                crash_data = {
-                    "timestamp": {
-                        "local": datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                        "utc": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                        "unix": time.time()
-                    },
-                    "participant_id": self.participant_id or 'UNKNOWN',
-                    "action_type": "APPLICATION_CRASH",
-                    "details": f"Application crashed with signal {signum}",
-                    "screen": self.current_screen,
-                    "session_duration_seconds": (datetime.now() - self.logging_manager.session_start_time).total_seconds()
-                }
-
-                with open(self.logging_manager.action_log_file_path, 'a') as f:
-                    f.write(json.dumps(crash_data) + '\n')
-
-                print("💾 Crash logged to file")
-            except Exception as e:
-                print(f"⚠️ Could not log crash: {e}")
-
-        # Clean up and exit
-        self.cleanup_resources()
-        exit(1)
+        """Handle application crash.
+        
+        Only writes the pre-encoded crash record and exits; no printing, resource
+        cleanup or atexit handlers run from signal context.
+        """
+        try:
+            self.logging_manager.write_crash_record(signum)
+        except Exception:
+            pass
+        signal.signal(signum, signal.SIG_DFL)
+        os._exit(1)
 
     def handle_app_exit(self):
         """Handle normal app exit."""
-        if hasattr(self.logging_manager, 'action_log_file_path') and self.logging_manager.action_log_file_path:
-            try:
-                if not hasattr(self, '_exit_logged'):
-                    print("🔚 Normal app exit detected")
-            except:
-                pass
+        if self.logging_manager.action_log_file_path and not self._exit_logged:
+            print("🔚 Normal app exit detected")
 
     def cleanup_resources(self):
         """Clean up all resources."""
@@ -341,6 +367,10 @@ class MolyApp(QMainWindow):
             self.video_manager.cleanup()
         except:
             pass
+        try:
+            self.task_manager.flush_assignments()
+        except:
+            pass
 
     def check_and_handle_recovery(self):
         """Check for incomplete sessions and handle recovery."""
@@ -365,11 +395,12 @@ class MolyApp(QMainWindow):
         print(f"🔄 Recovery data: {recovery_data['participant_id']} - {recovery_data['last_screen']}")
         
         # Initialize screens if not already done
-        if not hasattr(self, 'participant_id_screen'):
+        if self._screen_factories is None:
             self.initialize_screens()
         
-        # Create recovery screen
+        # Create recovery screen (built outside _get_screen, so added to the stack here)
         recovery_screen = RecoveryScreen(recovery_data, self)
+        self.stacked_widget.addWidget(recovery_screen)
         
         # Switch to recovery screen
         self.switch_to_screen(recovery_screen)
@@ -377,9 +408,9 @@ class MolyApp(QMainWindow):
         # Force window to front and ensure visibility
         self.raise_()
         self.activateWindow()
-        print("🔄 Recovery screen should now be visible - waiting for user input...")
-        print("🔄 If you don't see the recovery screen, check if it's behind other windows")
-        print("🔄 The recovery screen should show: 'An incomplete session was detected for ANOTHERID'")
+        dprint("🔄 Recovery screen should now be visible - waiting for user input...")
+        dprint("🔄 If you don't see the recovery screen, check if it's behind other windows")
+        dprint("🔄 The recovery screen should show: 'An incomplete session was detected for ANOTHERID'")
     
     def handle_recovery_choice(self, choice, recovery_data):
         """Handle the user's recovery choice."""
@@ -400,47 +431,51 @@ class MolyApp(QMainWindow):
         """PyQt6 timer callback replacement for tkinter's after method."""
         QTimer.singleShot(delay, callback)
         
+    @contextmanager
+    def _batched_updates(self, widget):
+        """Suspend painting of widget so a batch of changes is painted once."""
+        widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            widget.setUpdatesEnabled(True)
+    
     def clear_screen(self):
         """Clear current screen content."""
-        # Stop countdown timer first
-        self.countdown_manager.stop_countdown()
-        
-        # Stop video if running
-        self.video_manager.stop_video()
-        
-        # Clean up corner countdown if it exists
-        if hasattr(self, 'corner_countdown_label'):
-            try:
+        with self._batched_updates(self.central_widget):
+            # Stop countdown timer first
+            self.countdown_manager.stop_countdown()
+            
+            # Stop video if running
+            self.video_manager.stop_video()
+            
+            # Clean up corner countdown if it exists
+            if self.corner_countdown_label is not None:
                 self.corner_countdown_label.deleteLater()
-                del self.corner_countdown_label
-            except AttributeError:
-                pass
-            # Clear the reference in countdown manager
-            self.countdown_manager.set_corner_countdown_label(None)
-        
-        # Hide current screen widget if it exists
-        if self.current_screen_widget:
-            try:
-                self.current_screen_widget.hide()
-                self.stacked_widget.removeWidget(self.current_screen_widget)
-            except:
-                pass
-        
-        # Clear all key shortcuts (PyQt6 equivalent)
-        if hasattr(self, 'shortcuts'):
+                self.corner_countdown_label = None
+                # Clear the reference in countdown manager
+                self.countdown_manager.set_corner_countdown_label(None)
+            
+            # Hide current screen widget if it exists (it stays in the stack for reuse)
+            if self.current_screen_widget:
+                try:
+                    self.current_screen_widget.hide()
+                except:
+                    pass
+            
+            # Release only the app-level shortcuts that were actually registered
             for shortcut in self.shortcuts:
                 shortcut.setEnabled(False)
+                shortcut.deleteLater()
             self.shortcuts.clear()
-        else:
-            self.shortcuts = []
     
     # =================== SCREEN NAVIGATION METHODS ===================
     
     def show_participant_id_screen(self):
         """Show participant ID entry screen using modular screen."""
-        print("🆔 Showing Participant ID Entry Screen")
+        dprint("🆔 Showing Participant ID Entry Screen")
         # Initialize screens if not already done
-        if not hasattr(self, 'participant_id_screen'):
+        if self._screen_factories is None:
             self.initialize_screens()
         self.switch_to_screen(self.participant_id_screen)
     
@@ -460,42 +495,42 @@ class MolyApp(QMainWindow):
     
     def switch_to_prestudy_survey(self):
         """Show prestudy survey screen - this is now the default initial survey."""
-        print("📋 Switching to Prestudy Survey Screen")
+        dprint("📋 Switching to Prestudy Survey Screen")
         self.switch_to_screen(self.prestudy_screen)
     
     def switch_to_duringstudy1_survey(self):
         """Show during-study survey 1 screen."""
-        print("📋 Switching to During Study Survey 1 Screen")
+        dprint("📋 Switching to During Study Survey 1 Screen")
         self.switch_to_screen(self.duringstudy1_screen)
     
     def switch_to_duringstudy2_survey(self):
         """Show during-study survey 2 screen."""
-        print("📋 Switching to During Study Survey 2 Screen")
+        dprint("📋 Switching to During Study Survey 2 Screen")
         self.switch_to_screen(self.duringstudy2_screen)
     
     def switch_to_poststudy_survey(self):
         """Show poststudy survey screen."""
-        print("📊 Switching to Poststudy Survey Screen")
+        dprint("📊 Switching to Poststudy Survey Screen")
         self.switch_to_screen(self.poststudy_screen)
     
     def switch_to_consent(self):
         """Show consent screen using modular screen."""
-        print("📋 Switching to Consent Screen")
+        dprint("📋 Switching to Consent Screen")
         self.switch_to_screen(self.consent_screen)
     
     def switch_to_relaxation(self):
         """Show relaxation screen using modular screen."""
-        print("🧘 Switching to Relaxation Screen")
+        dprint("🧘 Switching to Relaxation Screen")
         self.switch_to_screen(self.relaxation_screen)
     
     def switch_to_descriptive_transition(self):
         """Show descriptive task transition screen."""
-        print("🔄 Switching to Descriptive Task Transition Screen")
+        dprint("🔄 Switching to Descriptive Task Transition Screen")
         self.switch_to_screen(self.descriptive_transition_screen)
     
     def switch_to_descriptive_task(self):
         """Show descriptive task screen using modular screen."""
-        print("🎯 Switching to Descriptive Task Screen")
+        dprint("🎯 Switching to Descriptive Task Screen")
         self.switch_to_screen(self.descriptive_task_screen)
     
     # =================== SURVEY INTEGRATION METHODS ===================
@@ -554,51 +589,18 @@ class MolyApp(QMainWindow):
         print(f"🔄 Attempting to resume to screen: {screen}")
 
         # Initialize screens if not already done
-        if not hasattr(self, 'participant_id_screen'):
+        if self._screen_factories is None:
             self.initialize_screens()
 
         if screen == 'descriptive_task':
             print("🔄 Resuming to descriptive task (reset state)")
             self.resume_descriptive_task_reset(recovery_state)
-        elif screen == 'relaxation':
-            print("🔄 Resuming to relaxation screen")
-            self.switch_to_relaxation()
-        elif screen == 'stroop':
-            print("🔄 Resuming to stroop screen")
-            self.switch_to_stroop()
-        elif screen == 'math_task':
-            print("🔄 Resuming to math task screen")
-            self.switch_to_math_task()
-        elif screen == 'post_study_rest':
-            print("🔄 Resuming to post-study rest screen")
-            self.switch_to_post_study_rest()
-        elif screen == 'content_performance':
-            print("🔄 Resuming to content performance screen")
-            self.switch_to_content_performance()
-        elif screen == 'consent':
-            print("🔄 Resuming to consent screen")
-            self.switch_to_consent()
-        elif screen == 'prestudy':
-            print("🔄 Resuming to prestudy survey")
-            self.switch_to_prestudy_survey()
-        elif screen == 'duringstudy1':
-            print("🔄 Resuming to during-study survey 1")
-            self.switch_to_duringstudy1_survey()
-        elif screen == 'duringstudy2':
-            print("🔄 Resuming to during-study survey 2")
-            self.switch_to_duringstudy2_survey()
-        elif screen == 'poststudy':
-            print("🔄 Resuming to post-study survey")
-            self.switch_to_poststudy_survey()
-        elif screen == 'descriptive_transition':
-            print("🔄 Resuming to descriptive task transition")
-            self.switch_to_descriptive_transition()
-        elif screen == 'stroop_transition':
-            print("🔄 Resuming to stroop transition")
-            self.switch_to_stroop_transition()
-        elif screen == 'math_transition':
-            print("🔄 Resuming to math transition")
-            self.switch_to_math_transition()
+            return
+        
+        switch = self._resume_dispatch.get(screen)
+        if switch:
+            print(f"🔄 Resuming to {screen} screen")
+            switch()
         else:
             print(f"🔄 Unknown screen '{screen}', going to participant ID screen")
             self.show_participant_id_screen()
@@ -621,7 +623,7 @@ class MolyApp(QMainWindow):
         
         # Reset descriptive task state completely
         self.current_prompt_index = 0
-        self.prompts = DESCRIPTIVE_PROMPTS.copy()
+        self.prompts = DESCRIPTIVE_PROMPTS
         
         # Reset task start flags
         self.descriptive_task_started = False
@@ -632,7 +634,7 @@ class MolyApp(QMainWindow):
         self._last_logged_length = 0
         
         # Update the modular screen's state if it exists
-        if hasattr(self, 'descriptive_task_screen') and hasattr(self.descriptive_task_screen, 'current_prompt_index'):
+        if 'descriptive_task' in self.screens and hasattr(self.descriptive_task_screen, 'current_prompt_index'):
             self.descriptive_task_screen.current_prompt_index = 0
             # Clear any existing text in the screen
             if hasattr(self.descriptive_task_screen, 'reset_task_state'):
@@ -656,7 +658,7 @@ class MolyApp(QMainWindow):
         
         # Reset descriptive task state
         self.current_prompt_index = 0
-        self.prompts = DESCRIPTIVE_PROMPTS.copy()
+        self.prompts = DESCRIPTIVE_PROMPTS
         
         # Clear recovery state
         self.recovery_manager.reset_recovery_state()
@@ -680,42 +682,42 @@ class MolyApp(QMainWindow):
     # Transition screen methods
     def switch_to_stroop_transition(self):
         """Switch to stroop transition screen."""
-        print("🔄 Switching to Stroop Transition Screen")
+        dprint("🔄 Switching to Stroop Transition Screen")
         self.switch_to_screen(self.stroop_transition_screen)
     
     def switch_to_stroop(self):
         """Switch to stroop screen."""
-        print("🎬 Switching to Stroop Screen")
+        dprint("🎬 Switching to Stroop Screen")
         self.switch_to_screen(self.stroop_screen)
     
     def switch_to_math_transition(self):
         """Switch to math task transition screen."""
-        print("🔄 Switching to Math Task Transition Screen")
+        dprint("🔄 Switching to Math Task Transition Screen")
         self.switch_to_screen(self.math_transition_screen)
     
     def switch_to_math_task(self):
         """Switch to math task screen."""
-        print("🧮 Switching to Math Task Screen")
+        dprint("🧮 Switching to Math Task Screen")
         self.switch_to_screen(self.math_screen)
     
     def switch_to_content_performance_transition(self):
         """Switch to content performance transition screen."""
-        print("🔄 Switching to Content Performance Transition Screen")
+        dprint("🔄 Switching to Content Performance Transition Screen")
         self.switch_to_screen(self.content_performance_transition_screen)
     
     def switch_to_content_performance(self):
         """Switch to content performance screen."""
-        print("📱 Switching to Content Performance Screen")
+        dprint("📱 Switching to Content Performance Screen")
         self.switch_to_screen(self.content_performance_screen)
     
     def switch_to_relaxation_transition(self):
         """Switch to relaxation transition screen."""
-        print("🔄 Switching to Relaxation Transition Screen")
+        dprint("🔄 Switching to Relaxation Transition Screen")
         self.switch_to_screen(self.relaxation_transition_screen)
     
     def switch_to_post_study_rest(self):
         """Switch to post-study rest screen."""
-        print("🧘 Switching to Post-Study Rest Screen")
+        dprint("🧘 Switching to Post-Study Rest Screen")
         self.switch_to_screen(self.post_study_rest_screen)
     
     def show_timeout_notification(self, screen_name):
@@ -747,11 +749,9 @@ class MolyApp(QMainWindow):
 
         self.logging_manager.finalize_session()
         self.running = False
-
-        # Wait for threads to finish
-        time.sleep(0.2)
         
-        # Clean up resources
+        # Clean up resources (joins the video decoder and waits for queued
+        # assignment writes, so no fixed sleep is needed for threads to finish)
         self.cleanup_resources()
         
         # Destroy window
@@ -765,19 +765,23 @@ class MolyApp(QMainWindow):
         try:
             print("🚀 Starting Moly Relaxation Application")
             
-            # Initialize screens after QApplication is ready
-            self.initialize_screens()
+            # Initialize screens after QApplication is ready (the recovery
+            # check may already have done so)
+            if self._screen_factories is None:
+                self.initialize_screens()
             
             # Only show participant ID screen if no recovery screen is already shown
-            if not hasattr(self, 'current_screen_widget') or self.current_screen_widget is None:
+            if self.current_screen_widget is None and self._pending_screen is None:
                 print("📖 Current screen: Participant ID")
-                if hasattr(self, 'participant_id_screen'):
-                    self.switch_to_screen(self.participant_id_screen)
+                self.switch_to_screen(self.participant_id_screen)
             
             # Start PyQt application
             self.show()
             self.raise_()  # Bring window to front
             self.activateWindow()  # Make sure it's the active window
+            
+            # Load OpenCV in the background once the first screen is up
+            QTimer.singleShot(0, self.video_manager.preload)
             sys.exit(self.app.exec())
         except KeyboardInterrupt:
             print("\n🔌 Keyboard interrupt - Shutting down...")
@@ -786,53 +790,87 @@ class MolyApp(QMainWindow):
             self.cleanup_resources()
     
     def switch_to_screen(self, screen_widget):
-        """Switch to a specific screen widget."""        
+        """Switch to a specific screen widget on the next event loop pass.
+        
+        Requests made before then are coalesced so only the last target is set
+        up and shown. Callers that need the switch to happen synchronously can
+        call _do_switch_to_screen directly.
+        """
+        self._pending_screen = screen_widget
+        if not self._switch_scheduled:
+            self._switch_scheduled = True
+            QTimer.singleShot(0, self._flush_switch)
+    
+    def _flush_switch(self):
+        """Show the latest pending screen.
+        
+        A failed switch is logged as SCREEN_TRANSITION_ERROR and falls back to
+        the screen shown before it (the participant ID screen if there was
+        none), so the app state matches what is on screen. The error is not
+        re-raised, as it would escape into the Qt event loop.
+        """
+        screen_widget = self._pending_screen
+        self._pending_screen = None
+        self._switch_scheduled = False
+        if screen_widget is None:
+            return
+        previous = self.current_screen_widget
         try:
-            print(f"🔍 switch_to_screen called with: {screen_widget}")
-            self.current_screen = getattr(screen_widget, 'screen_name', 'unknown')
-            print(f"🔍 Current screen set to: {self.current_screen}")
-            
-            # Log screen transition
-            self.logging_manager.log_action("SCREEN_TRANSITION", f"Switching to {self.current_screen} screen", self.current_screen)
-            
-            self.current_screen_widget = screen_widget
-            
-            # Important: Don't call screen_widget.show() directly!
-            # We'll only use the QStackedWidget for display
-            
-            # Add widget to stack if not already there
-            if self.stacked_widget.indexOf(screen_widget) == -1:
-                print("🔍 Adding screen widget to stack")
-                self.stacked_widget.addWidget(screen_widget)
-            else:
-                print("🔍 Screen widget already in stack")
-            
-            # Ensure screen is set up (calls setup_screen if needed)
-            if not hasattr(screen_widget, '_screen_setup_done'):
-                print(f"🔍 Setting up {self.current_screen} screen...")
-                screen_widget.show()  # This will trigger setup if needed
+            self._do_switch_to_screen(screen_widget)
+        except Exception as e:
+            target = getattr(screen_widget, 'screen_name', 'unknown')
+            self.logging_manager.log_action("SCREEN_TRANSITION_ERROR", f"Could not switch to {target} screen: {e}", target)
+            fallback = previous if previous is not None and previous is not screen_widget else self.participant_id_screen
+            if fallback is screen_widget:
+                return
+            print(f"⚠️ Falling back to {fallback.screen_name} screen")
+            try:
+                self._do_switch_to_screen(fallback)
+            except Exception as fallback_error:
+                print(f"⚠️ Fallback screen switch failed: {fallback_error}")
+    
+    def _do_switch_to_screen(self, screen_widget):
+        """Switch to a specific screen widget immediately.
+        
+        The widget must already be in the stack (added by _get_screen or, for
+        the recovery screen, by show_recovery_screen) and have a screen_name.
+        """        
+        stacked = self.stacked_widget
+        with self._batched_updates(self.central_widget):
+            try:
+                dprint(f"🔍 _do_switch_to_screen called with: {screen_widget}")
+                screen_name = self.current_screen = screen_widget.screen_name
+                dprint(f"🔍 Current screen set to: {screen_name}")
                 
-            # Switch to the screen
-            print("🔍 Setting current widget")
-            self.stacked_widget.setCurrentWidget(screen_widget)
-            print(f"🔍 Current widget index: {self.stacked_widget.currentIndex()}")
-            print(f"🔍 Widget count in stack: {self.stacked_widget.count()}")
-            
-            # Ensure widget is shown and focused
-            screen_widget.setEnabled(True)
-            if hasattr(screen_widget, 'setFocus'):
+                # Log screen transition
+                self.logging_manager.log_action("SCREEN_TRANSITION", f"Switching to {screen_name} screen", screen_name)
+                
+                self.current_screen_widget = screen_widget
+                
+                # Important: Don't call screen_widget.show() directly!
+                # We'll only use the QStackedWidget for display
+                
+                # Ensure screen is set up (calls setup_screen if needed)
+                if not hasattr(screen_widget, '_screen_setup_done'):
+                    dprint(f"🔍 Setting up {screen_name} screen...")
+                    screen_widget.show()  # This will trigger setup if needed
+                    
+                # Switch to the screen
+                dprint("🔍 Setting current widget")
+                stacked.setCurrentWidget(screen_widget)
+                dprint(f"🔍 Current widget index: {stacked.currentIndex()}")
+                dprint(f"🔍 Widget count in stack: {stacked.count()}")
+                
+                # Ensure widget is shown and focused
+                screen_widget.setEnabled(True)
                 screen_widget.setFocus()
-            
-            print(f"🔍 Screen switch completed successfully to: {self.current_screen}")
-            
-            # Force window update
-            self.update()
-            self.repaint()
-        except Exception as e:
-            print(f"⚠️ Error in switch_to_screen: {e}")
-            import traceback
-            print(f"⚠️ Full traceback: {traceback.format_exc()}")
-            raise
+                
+                dprint(f"🔍 Screen switch completed successfully to: {screen_name}")
+            except Exception as e:
+                print(f"⚠️ Error in switch_to_screen: {e}")
+                import traceback
+                print(f"⚠️ Full traceback: {traceback.format_exc()}")
+                raise
 
 
 def main():
@@ -49,11 +49,16 @@ DESCRIPTIVE_PROMPTS = [
     "Please write continuously for the next few minutes about a recent situation where you felt stressed while having to perform under time pressure (e.g., exam, interview, or work task). Describe what happened, how you felt, and what thoughts went through your mind. Do not stop writing until the time is up.",
     "Look at the picture on the screen. Describe in as much detail as possible what you see, what you think is happening, and what the people might be thinking or feeling. Keep writing continuously for the entire duration, without pausing."
 ]
+DESCRIPTIVE_MAX_RESPONSE_CHARS = 20000  # Response length covered by word counting and crash-recovery snapshots (responses are never cut)
 
 # STROOP SCREEN SETTINGS
 STROOP_VIDEO_PATH = os.path.join("res", "stroop.mov")
 GENERATE_STROOP_NATIVE = False  # When True, generates native word list instead of video
 
+# VIDEO PLAYBACK SETTINGS
+VIDEO_MAX_DISPLAY_FPS = 30  # Higher-FPS sources skip decoding frames that would never be shown
+VIDEO_HW_DECODE = True  # Ask OpenCV for hardware video decoding (VideoToolbox, etc.); falls back to software
+
 # MATH TASK SETTINGS
 MATH_STARTING_NUMBER = 4000
 MATH_SUBTRACTION_VALUE = 7
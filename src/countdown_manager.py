@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 
 import time
-from PyQt6.QtCore import QTimer
+import traceback
+from PyQt6.QtCore import Qt, QTimer
+from logging_manager import dprint
+
+# Interval between COUNTDOWN_STATE log entries used for crash recovery
+COUNTDOWN_LOG_INTERVAL_MS = 30000
 
 
 class CountdownManager:
@@ -15,12 +20,15 @@ class CountdownManager:
         self.countdown_running = False
         self.countdown_enabled = True
         
-        # Labels to update
+        # Labels to update, with their setText methods bound once
         self.countdown_label = None
         self.corner_countdown_label = None
+        self._set_countdown_text = None
+        self._set_corner_text = None
         
-        # Timer
+        # Timers
         self.timer = None
+        self.log_timer = None
         
         # Callbacks
         self.get_current_screen = None
@@ -30,8 +38,10 @@ class CountdownManager:
         
         # Tracking
         self.start_time = 0
+        self.deadline = 0  # time.monotonic() value at which the countdown ends
         self.initial_duration = 0
         self.screen_name = ""
+        self._last_displayed_sec = None
     
     def set_current_screen_callback(self, callback):
         """Set callback to get current screen."""
@@ -40,12 +50,14 @@ class CountdownManager:
     def setup_countdown_label(self, label):
         """Set the main countdown label widget."""
         self.countdown_label = label
-        print(f"🎯 DEBUG: Main countdown label set: {label is not None}, type: {type(label) if label else 'None'}")
+        self._set_countdown_text = label.setText if label is not None else None
+        dprint(f"🎯 DEBUG: Main countdown label set: {label is not None}, type: {type(label) if label else 'None'}")
     
     def set_corner_countdown_label(self, label):
         """Set the corner countdown label widget."""
         self.corner_countdown_label = label
-        print(f"🎯 DEBUG: Corner countdown label set: {label is not None}, type: {type(label) if label else 'None'}")
+        self._set_corner_text = label.setText if label is not None else None
+        dprint(f"🎯 DEBUG: Corner countdown label set: {label is not None}, type: {type(label) if label else 'None'}")
     
     def set_timeout_callback(self, callback):
         """Set callback for when countdown expires."""
@@ -69,30 +81,58 @@ class CountdownManager:
     
     def start_countdown(self, minutes, screen_name):
         """Start countdown timer for a screen."""
+        print(f"⏰ Starting {minutes} minute countdown for {screen_name}")
+        self.start_countdown_seconds(minutes * 60, screen_name)
+    
+    def start_countdown_seconds(self, seconds, screen_name):
+        """Start countdown timer for a screen with a duration in seconds."""
         if not self.countdown_enabled:
             print(f"⏰ Countdown disabled - not starting timer for {screen_name}")
             return
         
-        print(f"⏰ Starting {minutes} minute countdown for {screen_name}")
-        
         # Stop any existing countdown
         self.stop_countdown()
         
-        # Initialize countdown
-        self.initial_duration = minutes * 60  # Convert to seconds
+        # Initialize countdown against a monotonic deadline, so wall-clock
+        # adjustments can't stretch or skip the remaining time
+        self.initial_duration = seconds
         self.countdown_remaining = self.initial_duration
         self.countdown_running = True
         self.screen_name = screen_name
         self.start_time = time.time()
+        self.deadline = time.monotonic() + self.initial_duration
+        self._last_displayed_sec = None
         
         print(f"⏰ Countdown initialized: {self.countdown_remaining} seconds remaining")
         
-        # Create and start timer
+        # Create a single-shot timer that is re-armed for each displayed second
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.update_countdown)
-        self.timer.start(100)  # Update every 100ms
+        self.timer.start(0)  # First update right away
         
-        print(f"🎯 QTimer started for countdown updates")
+        dprint(f"🎯 QTimer started for countdown updates")
+        
+        # Log the countdown state on its own fixed interval, independent of ticks
+        self.log_timer = QTimer()
+        self.log_timer.timeout.connect(self._log_countdown_periodic)
+        self.log_timer.start(COUNTDOWN_LOG_INTERVAL_MS)
+    
+    def _log_countdown_periodic(self):
+        """Log the current countdown state for recovery - called by the log timer."""
+        if not self.countdown_running or not self.logging_manager:
+            return
+        remaining = max(0, int(self.deadline - time.monotonic()))
+        self.logging_manager.log_countdown_state(remaining, self.initial_duration, self.screen_name)
+    
+    def _schedule_next_tick(self):
+        """Re-arm the timer for the moment the displayed second changes."""
+        if not self.countdown_running or not self.timer:
+            return
+        # Wake up just after the next whole-second boundary instead of polling
+        delay_ms = int((self.countdown_remaining % 1) * 1000) + 5
+        self.timer.start(delay_ms if delay_ms > 5 else 1000)
     
     def update_countdown(self):
         """Update countdown display - called by QTimer."""
@@ -102,23 +142,28 @@ class CountdownManager:
                 return
             
             if self.get_current_screen and self.get_current_screen() != self.screen_name:
+                self._schedule_next_tick()
                 return
             
             # Calculate remaining time
-            elapsed = time.time() - self.start_time
-            self.countdown_remaining = max(0, self.initial_duration - elapsed)
+            self.countdown_remaining = max(0, self.deadline - time.monotonic())
             
-            # Convert to display format
+            # Nothing visible changes until the displayed second does
             total_seconds = int(self.countdown_remaining)
-            minutes = total_seconds // 60
-            seconds = total_seconds % 60
+            if total_seconds == self._last_displayed_sec and self.countdown_remaining > 0:
+                self._schedule_next_tick()
+                return
+            self._last_displayed_sec = total_seconds
+            
+            # Convert to display format
+            minutes, seconds = divmod(total_seconds, 60)
             
             # Debug print occasionally (every 5 seconds)
-            if total_seconds % 5 == 0 and self.countdown_remaining % 1 < 0.2:
-                print(f"🎯 Countdown update: {minutes}:{seconds:02d} remaining")
+            if total_seconds % 5 == 0:
+                dprint(f"🎯 Countdown update: {minutes}:{seconds:02d} remaining")
             
-            # Update main countdown label
-            if self.countdown_label:
+            # Update main countdown label (setText schedules the repaint itself)
+            if self._set_countdown_text:
                 if self.countdown_remaining > 60:
                     message = f"⏰ You only have {minutes}:{seconds:02d} left!"
                 elif self.countdown_remaining > 30:
@@ -128,20 +173,11 @@ class CountdownManager:
                 else:
                     message = f"🚨 TIME RUNNING OUT! {seconds}s!"
                 
-                if hasattr(self.countdown_label, 'setText'):
-                    self.countdown_label.setText(message)
-                    # Force widget update
-                    if hasattr(self.countdown_label, 'update'):
-                        self.countdown_label.update()
+                self._set_countdown_text(message)
             
             # Update corner countdown label
-            if self.corner_countdown_label:
-                corner_text = f"{minutes}:{seconds:02d}"
-                if hasattr(self.corner_countdown_label, 'setText'):
-                    self.corner_countdown_label.setText(corner_text)
-                    # Force widget update
-                    if hasattr(self.corner_countdown_label, 'update'):
-                        self.corner_countdown_label.update()
+            if self._set_corner_text:
+                self._set_corner_text(f"{minutes}:{seconds:02d}")
             
             # Call custom update callback if set
             if self.countdown_update_callback:
@@ -161,11 +197,13 @@ class CountdownManager:
                 
                 if self.timeout_callback:
                     self.timeout_callback(self.screen_name)
+                return
         
         except Exception as e:
             print(f"⚠️ Error in countdown update: {e}")
-            import traceback
             print(f"⚠️ Full traceback: {traceback.format_exc()}")
+        
+        self._schedule_next_tick()
     
     def stop_countdown(self):
         """Stop the countdown timer."""
@@ -175,7 +213,11 @@ class CountdownManager:
             self.timer.stop()
             self.timer = None
         
-        print("🎯 Countdown stopped")
+        if self.log_timer:
+            self.log_timer.stop()
+            self.log_timer = None
+        
+        dprint("🎯 Countdown stopped")
     
     def get_remaining_time(self):
         """Get remaining time in seconds."""
@@ -189,6 +231,4 @@ class CountdownManager:
     def restore_countdown_from_seconds(self, seconds_remaining, screen_name="descriptivetask"):
         """Restore countdown from a specific number of seconds remaining."""
         print(f"🔄 Restoring countdown with {seconds_remaining} seconds remaining for screen: {screen_name}")
-        # Convert to minutes and start
-        minutes = seconds_remaining / 60
-        self.start_countdown(minutes, screen_name)
\ No newline at end of file
+        self.start_countdown_seconds(seconds_remaining, screen_name)
\ No newline at end of file
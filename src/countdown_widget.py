@@ -8,6 +8,33 @@ Provides consistent countdown functionality across all task screens.
 from PyQt6.QtWidgets import QLabel
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
+from logging_manager import dprint
+
+# Urgency tiers of the main countdown (and HURRY) label, most relaxed first:
+# (percent remaining the tier applies above, message template, text color,
+#  background, border color key in screen colors, default border color)
+COUNTDOWN_TIERS = (
+    (50, "⏰ You have {minutes}:{seconds:02d} left!", "white", "rgba(0, 0, 0, 150)", 'countdown_normal', '#00FF00'),
+    (25, "⚠️ HURRY! Only {minutes}:{seconds:02d} left!", "black", "rgba(255, 165, 0, 180)", 'countdown_warning', '#FFFF00'),
+    (10, "🚨 CRITICAL! Only {seconds} seconds left!", "white", "rgba(255, 0, 0, 180)", 'countdown_critical', '#FF0000'),
+    (0, "⏰ TIME RUNNING OUT! {seconds}s!", "white", "rgba(255, 0, 0, 220)", 'countdown_critical', '#FF0000'),
+)
+
+# Urgency tiers of the corner countdown: (percent remaining the tier applies
+# above, text color, background, border color key, default border color)
+CORNER_COUNTDOWN_TIERS = (
+    (50, "white", "rgba(0, 0, 0, 200)", 'countdown_normal', '#00FF00'),
+    (25, "black", "rgba(255, 255, 0, 100)", 'countdown_warning', '#FFFF00'),
+    (0, "white", "rgba(255, 0, 0, 150)", 'countdown_critical', '#FF0000'),
+)
+
+
+def _countdown_tier(percentage_remaining, tiers):
+    """Return the index of the first tier percentage_remaining is above (the last tier otherwise)."""
+    for index in range(len(tiers) - 1):
+        if percentage_remaining > tiers[index][0]:
+            return index
+    return len(tiers) - 1
 
 
 class CountdownWidget:
@@ -28,6 +55,7 @@ class CountdownWidget:
         """
         self.parent_screen = parent_screen
         self.countdown_minutes = countdown_minutes
+        self.total_seconds = countdown_minutes * 60
         self.show_main_display = show_main_display
         self.show_corner_display = show_corner_display
         
@@ -36,6 +64,12 @@ class CountdownWidget:
         self.corner_countdown_label = None
         self.hurry_label = None
         
+        # Urgency tier currently styled on each label; stylesheets are only
+        # re-applied (re-parsed and re-polished by Qt) when the tier changes
+        self._main_style_tier = None
+        self._hurry_style_tier = None
+        self._corner_style_tier = None
+        
         # Setup countdown displays
         if self.show_main_display:
             self.setup_main_countdown()
@@ -142,7 +176,7 @@ class CountdownWidget:
                 parent_width = getattr(self.parent_screen.app, 'screen_width', 1920)
                 parent_height = getattr(self.parent_screen.app, 'screen_height', 1080)
             
-            print(f"🎯 DEBUG: Positioning corner countdown - parent_width:{parent_width}, parent_height:{parent_height}")
+            dprint(f"🎯 DEBUG: Positioning corner countdown - parent_width:{parent_width}, parent_height:{parent_height}")
             
             # Calculate responsive dimensions based on screen size - increased for better visibility
             width = min(320, int(parent_width * 0.18))  # Increased max width and percentage
@@ -163,30 +197,33 @@ class CountdownWidget:
             if x_pos + width > parent_width:
                 x_pos = parent_width - width - 5
             
-            print(f"🎯 DEBUG: Setting corner countdown geometry to: x:{x_pos}, y:{y_pos}, w:{width}, h:{height}")
-            self.corner_countdown_label.setGeometry(x_pos, y_pos, width, height)
+            dprint(f"🎯 DEBUG: Setting corner countdown geometry to: x:{x_pos}, y:{y_pos}, w:{width}, h:{height}")
+            # A fixed size (rather than setGeometry) keeps the per-second setText
+            # from invalidating and re-running the parent screen's layout
+            self.corner_countdown_label.setFixedSize(width, height)
+            self.corner_countdown_label.move(x_pos, y_pos)
             self.corner_countdown_label.show()
             self.corner_countdown_label.raise_()
             
             # Force the label to be visible and on top
             self.corner_countdown_label.setVisible(True)
             self.corner_countdown_label.activateWindow()
-            print(f"🎯 DEBUG: Corner countdown positioned and shown with improved auto-sizing")
+            dprint(f"🎯 DEBUG: Corner countdown positioned and shown with improved auto-sizing")
     
     def start_countdown(self, auto_transition_callback, update_callback=None):
         """Start the countdown timer with the countdown manager."""
         if self.parent_screen.countdown_enabled:
-            print(f"🎯 DEBUG: Setting up countdown labels for {self.parent_screen.screen_name}...")
+            dprint(f"🎯 DEBUG: Setting up countdown labels for {self.parent_screen.screen_name}...")
             
             # Set up countdown manager with our labels
             if self.countdown_label:
-                print(f"🎯 DEBUG: Main countdown label exists: {self.countdown_label is not None}")
-                print(f"🎯 DEBUG: Main label text: {self.countdown_label.text() if self.countdown_label else 'None'}")
+                dprint(f"🎯 DEBUG: Main countdown label exists: {self.countdown_label is not None}")
+                dprint(f"🎯 DEBUG: Main label text: {self.countdown_label.text() if self.countdown_label else 'None'}")
                 self.parent_screen.app.countdown_manager.setup_countdown_label(self.countdown_label)
             
             if self.corner_countdown_label:
-                print(f"🎯 DEBUG: Corner countdown label exists: {self.corner_countdown_label is not None}")
-                print(f"🎯 DEBUG: Corner label text: {self.corner_countdown_label.text() if self.corner_countdown_label else 'None'}")
+                dprint(f"🎯 DEBUG: Corner countdown label exists: {self.corner_countdown_label is not None}")
+                dprint(f"🎯 DEBUG: Corner label text: {self.corner_countdown_label.text() if self.corner_countdown_label else 'None'}")
                 self.parent_screen.app.countdown_manager.set_corner_countdown_label(self.corner_countdown_label)
                 # Position corner countdown
                 self.position_corner_countdown()
@@ -199,131 +236,93 @@ class CountdownWidget:
             self.parent_screen.app.countdown_manager.set_countdown_update_callback(unified_callback)
             
             # Start the countdown
-            print(f"🎯 DEBUG: Starting countdown with {self.countdown_minutes} minutes...")
-            print(f"🎯 DEBUG: Using screen name: {self.parent_screen.screen_name}")
+            dprint(f"🎯 DEBUG: Starting countdown with {self.countdown_minutes} minutes...")
+            dprint(f"🎯 DEBUG: Using screen name: {self.parent_screen.screen_name}")
             self.parent_screen.app.countdown_manager.start_countdown(self.countdown_minutes, self.parent_screen.screen_name)
     
     def create_unified_update_callback(self, additional_callback=None):
         """Create a unified countdown update callback that handles combined countdown display and colors."""
         def unified_callback(remaining_seconds):
-            total_seconds = self.countdown_minutes * 60
-            percentage_remaining = (remaining_seconds / total_seconds) * 100
-            minutes = remaining_seconds // 60
-            seconds = remaining_seconds % 60
+            percentage_remaining = (remaining_seconds / self.total_seconds) * 100
+            minutes, seconds = divmod(remaining_seconds, 60)
+            tier = _countdown_tier(percentage_remaining, COUNTDOWN_TIERS)
+            _, template, text_color, bg_color, border_key, default_border = COUNTDOWN_TIERS[tier]
             
             # Update main countdown label with combined information (if exists)
-            if hasattr(self, 'countdown_label') and self.countdown_label:
-                if percentage_remaining > 50:
-                    message = f"⏰ You have {minutes}:{seconds:02d} left!"
-                    text_color = "white"
-                    bg_color = "rgba(0, 0, 0, 150)"
-                    border_color = self.parent_screen.colors.get('countdown_normal', '#00FF00')
-                elif percentage_remaining > 25:
-                    message = f"⚠️ HURRY! Only {minutes}:{seconds:02d} left!"
-                    text_color = "black"  # Black text for better contrast on yellow/orange
-                    bg_color = "rgba(255, 165, 0, 180)"
-                    border_color = self.parent_screen.colors.get('countdown_warning', '#FFFF00')
-                elif percentage_remaining > 10:
-                    message = f"🚨 CRITICAL! Only {seconds} seconds left!"
-                    text_color = "white"  # White text for contrast on red background
-                    bg_color = "rgba(255, 0, 0, 180)"
-                    border_color = self.parent_screen.colors.get('countdown_critical', '#FF0000')
-                else:
-                    message = f"⏰ TIME RUNNING OUT! {seconds}s!"
-                    text_color = "white"  # White text for contrast on red background
-                    bg_color = "rgba(255, 0, 0, 220)"
-                    border_color = self.parent_screen.colors.get('countdown_critical', '#FF0000')
-                
-                self.countdown_label.setText(message)
-                self.countdown_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {text_color};
-                        background-color: {bg_color};
-                        padding: 15px;
-                        border-radius: 10px;
-                        border: 2px solid {border_color};
-                        font-weight: bold;
-                        margin: 5px;
-                    }}
-                """)
-            
-            # Update HURRY label for corner-only displays (when main display is not shown)
-            if hasattr(self, 'hurry_label') and self.hurry_label and not self.show_main_display:
-                if percentage_remaining <= 50:  # Show when 50% or less time remaining
-                    if percentage_remaining > 25:  # 25-50% remaining
-                        message = f"⚠️ HURRY! Only {minutes}:{seconds:02d} left!"
-                        text_color = "black"  # Black text for better contrast
-                        bg_color = "rgba(255, 165, 0, 180)"
-                        border_color = self.parent_screen.colors.get('countdown_warning', '#FFFF00')
-                    elif percentage_remaining > 10:  # 10-25% remaining
-                        message = f"🚨 CRITICAL! Only {seconds} seconds left!"
-                        text_color = "white"  # White text for contrast
-                        bg_color = "rgba(255, 0, 0, 180)"
-                        border_color = self.parent_screen.colors.get('countdown_critical', '#FF0000')
-                    else:  # Less than 10% remaining
-                        message = f"⏰ TIME RUNNING OUT! {seconds}s!"
-                        text_color = "white"  # White text for contrast
-                        bg_color = "rgba(255, 0, 0, 220)"
-                        border_color = self.parent_screen.colors.get('countdown_critical', '#FF0000')
-                    
-                    self.hurry_label.setText(message)
-                    self.hurry_label.setStyleSheet(f"""
+            if self.countdown_label:
+                self.countdown_label.setText(template.format(minutes=minutes, seconds=seconds))
+                if tier != self._main_style_tier:
+                    self._main_style_tier = tier
+                    border_color = self.parent_screen.colors.get(border_key, default_border)
+                    self.countdown_label.setStyleSheet(f"""
                         QLabel {{
                             color: {text_color};
                             background-color: {bg_color};
-                            padding: 12px 20px;
-                            border-radius: 8px;
+                            padding: 15px;
+                            border-radius: 10px;
                             border: 2px solid {border_color};
                             font-weight: bold;
                             margin: 5px;
                         }}
                     """)
-                    self.hurry_label.show()
-                    
-                    # Position HURRY label in center of screen for visibility
-                    parent_width = self.parent_screen.width() if self.parent_screen.width() > 0 else self.parent_screen.app.screen_width
-                    parent_height = self.parent_screen.height() if self.parent_screen.height() > 0 else self.parent_screen.app.screen_height
-                    
-                    # Center the label on screen
-                    label_width = 600
-                    label_height = 80
-                    x_pos = (parent_width - label_width) // 2
-                    y_pos = parent_height // 3  # Upper third of screen
-                    
-                    # Set geometry if the label supports it
-                    try:
-                        self.hurry_label.setGeometry(x_pos, y_pos, label_width, label_height)
-                        self.hurry_label.raise_()
-                    except:
-                        pass  # Fallback to normal layout positioning
-                else:
+            
+            # Update HURRY label for corner-only displays (when main display is not shown)
+            if self.hurry_label and not self.show_main_display:
+                if tier > 0:  # Show when 50% or less time remaining
+                    self.hurry_label.setText(template.format(minutes=minutes, seconds=seconds))
+                    if tier != self._hurry_style_tier:
+                        self._hurry_style_tier = tier
+                        border_color = self.parent_screen.colors.get(border_key, default_border)
+                        self.hurry_label.setStyleSheet(f"""
+                            QLabel {{
+                                color: {text_color};
+                                background-color: {bg_color};
+                                padding: 12px 20px;
+                                border-radius: 8px;
+                                border: 2px solid {border_color};
+                                font-weight: bold;
+                                margin: 5px;
+                            }}
+                        """)
+                        self.hurry_label.show()
+                        
+                        # Position HURRY label in center of screen for visibility
+                        parent_width = self.parent_screen.width() if self.parent_screen.width() > 0 else self.parent_screen.app.screen_width
+                        parent_height = self.parent_screen.height() if self.parent_screen.height() > 0 else self.parent_screen.app.screen_height
+                        
+                        # Center the label on screen
+                        label_width = 600
+                        label_height = 80
+                        x_pos = (parent_width - label_width) // 2
+                        y_pos = parent_height // 3  # Upper third of screen
+                        
+                        # Set geometry if the label supports it
+                        try:
+                            self.hurry_label.setGeometry(x_pos, y_pos, label_width, label_height)
+                            self.hurry_label.raise_()
+                        except:
+                            pass  # Fallback to normal layout positioning
+                elif self._hurry_style_tier != 0:
+                    self._hurry_style_tier = 0
                     self.hurry_label.hide()
             
             # Update corner countdown colors and ensure proper contrast based on percentage
-            if hasattr(self, 'corner_countdown_label') and self.corner_countdown_label:
-                if percentage_remaining > 50:
-                    border_color = self.parent_screen.colors.get('countdown_normal', '#00FF00')
-                    text_color = "white"
-                    bg_color = "rgba(0, 0, 0, 200)"
-                elif percentage_remaining > 25:
-                    border_color = self.parent_screen.colors.get('countdown_warning', '#FFFF00')
-                    text_color = "black"  # Black text for better contrast on yellow
-                    bg_color = "rgba(255, 255, 0, 100)"  # Light yellow background
-                else:
-                    border_color = self.parent_screen.colors.get('countdown_critical', '#FF0000')
-                    text_color = "white"  # White text for contrast on red
-                    bg_color = "rgba(255, 0, 0, 150)"  # Red background
-                
-                self.corner_countdown_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {text_color};
-                        background-color: {bg_color};
-                        border: 4px solid {border_color};
-                        padding: 20px;
-                        border-radius: 15px;
-                        font-weight: bold;
-                    }}
-                """)
+            if self.corner_countdown_label:
+                corner_tier = _countdown_tier(percentage_remaining, CORNER_COUNTDOWN_TIERS)
+                if corner_tier != self._corner_style_tier:
+                    self._corner_style_tier = corner_tier
+                    _, text_color, bg_color, border_key, default_border = CORNER_COUNTDOWN_TIERS[corner_tier]
+                    border_color = self.parent_screen.colors.get(border_key, default_border)
+                    self.corner_countdown_label.setStyleSheet(f"""
+                        QLabel {{
+                            color: {text_color};
+                            background-color: {bg_color};
+                            border: 4px solid {border_color};
+                            padding: 20px;
+                            border-radius: 15px;
+                            font-weight: bold;
+                        }}
+                    """)
             
             # Call additional callback if provided (for task-specific updates)
             if additional_callback:
@@ -336,8 +335,8 @@ class CountdownWidget:
         try:
             if hasattr(self.parent_screen, 'app') and hasattr(self.parent_screen.app, 'countdown_manager'):
                 self.parent_screen.app.countdown_manager.stop_countdown()
-                print(f"🎯 DEBUG: Countdown stopped via unified widget")
+                dprint(f"🎯 DEBUG: Countdown stopped via unified widget")
             else:
-                print(f"🎯 DEBUG: No countdown manager available to stop")
+                dprint(f"🎯 DEBUG: No countdown manager available to stop")
         except Exception as e:
             print(f"⚠️ Error stopping countdown via unified widget: {e}")
\ No newline at end of file
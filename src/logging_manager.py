@@ -1,10 +1,82 @@
 #!/usr/bin/env python3
 
+import io
 import os
 import json
 import time
 import sys
-from datetime import datetime, timezone
+import atexit
+import threading
+from collections import deque
+from datetime import datetime
+
+# orjson is optional; it serializes straight to bytes and is much faster than
+# the stdlib encoder for the small dicts emitted per log event.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    orjson = None
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def _dumps_pretty(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Buffered log writes are flushed at least this often (seconds)...
+LOG_FLUSH_INTERVAL = 0.25
+# ...or as soon as this many lines are pending for a single file
+LOG_FLUSH_MAX_ENTRIES = 64
+# Most technical log lines buffered; past it the oldest are dropped rather
+# than blocking the UI thread on a stalled disk. Action and response lines
+# are participant data and are never dropped.
+LOG_QUEUE_MAX_ENTRIES = 4096
+# Partial-text snapshots are coalesced and written at most this often (seconds)
+PARTIAL_TEXT_DEBOUNCE = 0.5
+# Present while a session is running; removed by finalize_session. Startup only
+# scans logs/ for incomplete sessions when this marker survived a crash.
+INCOMPLETE_SESSION_MARKER = os.path.join("logs", ".incomplete")
+
+try:
+    from config import DEVELOPER_MODE
+except ImportError:
+    DEVELOPER_MODE = False
+
+def count_words(text):
+    """Count whitespace-separated words.
+    
+    str.split() builds a throwaway list but runs in C, which measures several
+    times faster than counting regex matches in Python.
+    """
+    return len(text.split()) if text else 0
+
+
+def dprint(message):
+    """Print routine per-entry status lines in developer mode only."""
+    if DEVELOPER_MODE:
+        sys.stdout.write(message + '\n')
+
+
+def _format_timestamp(t, unix_key="unix", into=None):
+    """Build the local/UTC/unix timestamp dict used in log entries from one time.time() value.
+    
+    If ``into`` is given, that dict is filled in place instead of allocating a new one.
+    """
+    sec = int(t)
+    ms = int((t - sec) * 1000)
+    lt = time.localtime(sec)
+    ut = time.gmtime(sec)
+    timestamp = {} if into is None else into
+    timestamp["local"] = f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} {lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}.{ms:03d}"
+    timestamp["utc"] = f"{ut.tm_year:04d}-{ut.tm_mon:02d}-{ut.tm_mday:02d} {ut.tm_hour:02d}:{ut.tm_min:02d}:{ut.tm_sec:02d}.{ms:03d}"
+    timestamp[unix_key] = t
+    return timestamp
 
 
 class ConsoleCapture:
@@ -25,8 +97,8 @@ class ConsoleCapture:
             pass  # Don't break if original stream fails
         
         # Log to tech log if message is not empty and not just whitespace
-        if (message.strip() and hasattr(self.logging_manager, 'tech_log_file_path') 
-            and not self._logging_in_progress and self.logging_manager.tech_log_file_path):
+        if (message.strip() and self.logging_manager.tech_log_file_path
+            and not self._logging_in_progress):
             try:
                 self._logging_in_progress = True
                 self.logging_manager.log_tech_message(
@@ -58,11 +130,78 @@ class LoggingManager:
         self.action_log_file_path = None
         self.descriptive_response_file_path = None
         self.tech_log_file_path = None
+        self._log_file_names = {}
+        self._session_info = None  # In-memory copy of the session_info file
         
         # Console output capturing
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
         self.console_capture_active = False
+        
+        # Buffered JSONL writing: pending lines and open handles keyed by path.
+        # _log_lock only guards the buffers, so callers never wait on disk I/O;
+        # _write_lock serializes the writer thread and explicit flushes.
+        self._log_buffers = {}
+        self._log_files = {}
+        self._log_lock = threading.RLock()
+        self._write_lock = threading.RLock()
+        self._dropped_lines = 0
+        self._log_wakeup = threading.Event()
+        self._log_writer = None  # Started with the first queued line
+        self._pending_partial = None
+        self._partial_timer = None
+        atexit.register(self.flush_logs)
+        atexit.register(self.flush_partial_text)  # atexit is LIFO: runs before flush_logs
+        
+        # Pre-opened action log fd and pre-encoded record for the crash handler
+        self._crash_fd = None
+        self._crash_record_prefix = b""
+        self._crash_screen = b'"unknown"'  # JSON-encoded screen name, set by set_crash_screen
+        
+        # Reusable entry dicts for the high-rate action and tech logs. They are
+        # filled in place and serialized under _log_lock, so key order (and
+        # therefore the JSONL layout) stays fixed.
+        self._action_entry = {
+            "timestamp": {"local": "", "utc": "", "unix": 0.0},
+            "participant_id": None,
+            "action_type": "",
+            "details": "",
+            "screen": "",
+            "session_duration_seconds": 0.0
+        }
+        self._tech_entry = {
+            "timestamp": {"local": "", "utc": "", "unix": 0.0},
+            "participant_id": None,
+            "level": "",
+            "message": "",
+            "screen": "",
+            "session_duration_seconds": 0.0
+        }
+        
+        # Countdown state logging is skipped when disabled or unchanged
+        try:
+            from config import COUNTDOWN_ENABLED
+            self.countdown_enabled = COUNTDOWN_ENABLED
+        except ImportError:
+            self.countdown_enabled = True
+        
+        # Sentence logging is checked per sentence, so resolve the flag once
+        try:
+            from config import DESCRIPTIVE_LINE_LOGGING
+            self.line_logging_enabled = DESCRIPTIVE_LINE_LOGGING
+        except ImportError:
+            self.line_logging_enabled = True
+        self._last_logged_countdown = None
+    
+    @property
+    def session_start_time(self):
+        return self._session_start_time
+
+    @session_start_time.setter
+    def session_start_time(self, value):
+        # Cache the unix value so per-entry durations are a float subtraction
+        self._session_start_time = value
+        self._session_start_unix = value.timestamp()
     
     def setup_logging_for_participant(self, participant_id):
         """Set up logging files for a participant."""
@@ -73,17 +212,25 @@ class LoggingManager:
         self.log_dir = os.path.join("logs", participant_id)
         os.makedirs(self.log_dir, exist_ok=True)
 
-        # Set up file paths in the organized structure
-        self.session_info_file_path = os.path.join(self.log_dir, f"session_info_{timestamp}.json")
-        self.action_log_file_path = os.path.join(self.log_dir, f"actions_{timestamp}.jsonl")
-        self.descriptive_response_file_path = os.path.join(self.log_dir, f"descriptive_responses_{timestamp}.jsonl")
-        self.tech_log_file_path = os.path.join(self.log_dir, f"tech_log_{timestamp}.jsonl")
+        # Set up file paths in the organized structure. File names are kept so
+        # they never have to be re-derived from the paths.
+        self._log_file_names = {
+            "session_info": f"session_info_{timestamp}.json",
+            "actions_log": f"actions_{timestamp}.jsonl",
+            "descriptive_responses": f"descriptive_responses_{timestamp}.jsonl",
+            "tech_log": f"tech_log_{timestamp}.jsonl"
+        }
+        self.session_info_file_path = os.path.join(self.log_dir, self._log_file_names["session_info"])
+        self.action_log_file_path = os.path.join(self.log_dir, self._log_file_names["actions_log"])
+        self.descriptive_response_file_path = os.path.join(self.log_dir, self._log_file_names["descriptive_responses"])
+        self.tech_log_file_path = os.path.join(self.log_dir, self._log_file_names["tech_log"])
 
         # Create the log files
         self.create_session_info_file()
         self.setup_action_logging()
         self.setup_descriptive_response_logging()
         self.setup_tech_logging()
+        self.prepare_crash_record()
         
         # Enable console output capture
         self.enable_console_capture()
@@ -98,11 +245,7 @@ class LoggingManager:
             
             session_info = {
                 "participant_id": self.participant_id,
-                "session_start_time": {
-                    "local": datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "utc": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "unix_timestamp": time.time()
-                },
+                "session_start_time": _format_timestamp(time.time(), "unix_timestamp"),
                 "application_version": "1.0",
                 "configuration": {
                     "developer_mode": DEVELOPER_MODE,
@@ -115,28 +258,44 @@ class LoggingManager:
                     "task_selection_mode": TASK_SELECTION_MODE
                 },
                 "file_structure": {
-                    "actions_log": os.path.basename(self.action_log_file_path),
-                    "descriptive_responses": os.path.basename(self.descriptive_response_file_path),
-                    "tech_log": os.path.basename(self.tech_log_file_path),
-                    "session_info": os.path.basename(self.session_info_file_path)
+                    "actions_log": self._log_file_names["actions_log"],
+                    "descriptive_responses": self._log_file_names["descriptive_responses"],
+                    "tech_log": self._log_file_names["tech_log"],
+                    "session_info": self._log_file_names["session_info"]
                 }
             }
 
-            with open(self.session_info_file_path, 'w') as f:
-                json.dump(session_info, f, indent=2)
+            self._session_info = session_info
+            self._write_session_info()
 
             self.tech_print(f"📋 Session info file created: {self.session_info_file_path}")
         except Exception as e:
             print(f"⚠️ Warning: Could not create session info file: {e}")
 
+    def _load_session_info(self):
+        """Return the in-memory session info, reading the file once if needed (e.g. after recovery)."""
+        if self._session_info is None:
+            with open(self.session_info_file_path, 'rb') as f:
+                self._session_info = json.loads(f.read())
+        return self._session_info
+
+    def _write_session_info(self):
+        """Atomically replace the session info file with the in-memory copy."""
+        tmp_path = self.session_info_file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps_pretty(self._session_info))
+        os.replace(tmp_path, self.session_info_file_path)
+
     def setup_action_logging(self):
         """Initialize the action logging system with JSONL format."""
         try:
             # JSONL format doesn't need headers - each line is a complete JSON object
-            # Create empty file
-            with open(self.action_log_file_path, 'w'):
-                pass  # Create empty file
+            # Create empty file and keep it open for appends
+            self._open_log_file(self.action_log_file_path, truncate=True)
             self.tech_print(f"📊 Action log file created: {self.action_log_file_path}")
+            
+            with open(INCOMPLETE_SESSION_MARKER, 'w') as f:
+                f.write(self.log_dir)
         except Exception as e:
             print(f"⚠️ Warning: Could not create action log file: {e}")
 
@@ -144,9 +303,8 @@ class LoggingManager:
         """Initialize the descriptive response logging system with JSONL format."""
         try:
             # JSONL format doesn't need headers - each line is a complete JSON object
-            # Create empty file
-            with open(self.descriptive_response_file_path, 'w'):
-                pass  # Create empty file
+            # Create empty file and keep it open for appends
+            self._open_log_file(self.descriptive_response_file_path, truncate=True)
             self.tech_print(f"📝 Descriptive response file created: {self.descriptive_response_file_path}")
         except Exception as e:
             print(f"⚠️ Warning: Could not create descriptive response file: {e}")
@@ -155,9 +313,8 @@ class LoggingManager:
         """Initialize the tech logging system with JSONL format."""
         try:
             # JSONL format doesn't need headers - each line is a complete JSON object
-            # Create empty file
-            with open(self.tech_log_file_path, 'w'):
-                pass  # Create empty file
+            # Create empty file and keep it open for appends
+            self._open_log_file(self.tech_log_file_path, truncate=True)
             print(f"🔧 Tech log file created: {self.tech_log_file_path}")  # Can't use tech_print here yet
         except Exception as e:
             print(f"⚠️ Warning: Could not create tech log file: {e}")
@@ -168,28 +325,44 @@ class LoggingManager:
             return
 
         try:
-            now = datetime.now()
-            now_utc = datetime.now(timezone.utc)
-
-            log_entry = {
-                "timestamp": {
-                    "local": now.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "utc": now_utc.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "unix": time.time()
-                },
-                "participant_id": self.participant_id,
-                "action_type": action,
-                "details": details,
-                "screen": current_screen,
-                "session_duration_seconds": (now - self.session_start_time).total_seconds()
-            }
+            now = time.time()
+
+            with self._log_lock:
+                log_entry = self._action_entry
+                _format_timestamp(now, into=log_entry["timestamp"])
+                log_entry["participant_id"] = self.participant_id
+                log_entry["action_type"] = action
+                log_entry["details"] = details
+                log_entry["screen"] = current_screen
+                log_entry["session_duration_seconds"] = now - self._session_start_unix
+                self._queue_log_line(self.action_log_file_path, _dumps(log_entry))
+
+            dprint(f"📊 Action logged: {action}")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not log action: {e}")
 
-            with open(self.action_log_file_path, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+    def log_actions_batch(self, entries, current_screen="unknown"):
+        """Log several (action, details) pairs that happen together, sharing one timestamp."""
+        if not self.action_log_file_path:
+            return
 
-            print(f"📊 Action logged: {action}")
+        try:
+            now = time.time()
+
+            with self._log_lock:
+                log_entry = self._action_entry
+                _format_timestamp(now, into=log_entry["timestamp"])
+                log_entry["participant_id"] = self.participant_id
+                log_entry["screen"] = current_screen
+                log_entry["session_duration_seconds"] = now - self._session_start_unix
+                for action, details in entries:
+                    log_entry["action_type"] = action
+                    log_entry["details"] = details
+                    self._queue_log_line(self.action_log_file_path, _dumps(log_entry))
+
+            dprint(f"📊 Actions logged: {', '.join(action for action, _ in entries)}")
         except Exception as e:
-            print(f"⚠️ Warning: Could not log action: {e}")
+            print(f"⚠️ Warning: Could not log actions: {e}")
 
     def log_descriptive_response(self, prompt_index, prompt_text, response_text):
         """Log descriptive task response to file in JSONL format."""
@@ -197,57 +370,43 @@ class LoggingManager:
             return
 
         try:
-            now = datetime.now()
-            now_utc = datetime.now(timezone.utc)
+            now = time.time()
 
             response_entry = {
-                "timestamp": {
-                    "local": now.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "utc": now_utc.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "unix": time.time()
-                },
+                "timestamp": _format_timestamp(now),
                 "participant_id": self.participant_id,
                 "prompt_index": prompt_index + 1,
                 "prompt_text": prompt_text,
                 "response_text": response_text,
-                "word_count": len(response_text.split()) if response_text else 0,
+                "word_count": count_words(response_text),
                 "character_count": len(response_text) if response_text else 0,
-                "session_duration_seconds": (now - self.session_start_time).total_seconds()
+                "session_duration_seconds": now - self._session_start_unix
             }
 
-            with open(self.descriptive_response_file_path, 'a') as f:
-                f.write(json.dumps(response_entry) + '\n')
+            self._queue_log_line(self.descriptive_response_file_path, _dumps(response_entry))
 
-            print(f"📝 Descriptive response logged for prompt {prompt_index + 1}")
+            dprint(f"📝 Descriptive response logged for prompt {prompt_index + 1}")
         except Exception as e:
             print(f"⚠️ Warning: Could not log descriptive response: {e}")
 
     def log_tech_message(self, message, level="INFO", current_screen="unknown"):
         """Log technical/console messages to tech log file in JSONL format."""
-        if not hasattr(self, 'tech_log_file_path') or not self.tech_log_file_path:
+        if not self.tech_log_file_path:
             return
 
         try:
-            now = datetime.now()
-            now_utc = datetime.now(timezone.utc)
-
-            tech_entry = {
-                "timestamp": {
-                    "local": now.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "utc": now_utc.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "unix": time.time()
-                },
-                "participant_id": self.participant_id or 'unknown',
-                "level": level,
-                "message": message,
-                "screen": current_screen,
-                "session_duration_seconds": (now - self.session_start_time).total_seconds() if hasattr(self, 'session_start_time') else 0
-            }
-
-            # Write directly to file to avoid infinite recursion with console capture
-            with open(self.tech_log_file_path, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(tech_entry, ensure_ascii=False) + '\n')
-                f.flush()  # Ensure immediate write
+            now = time.time()
+
+            with self._log_lock:
+                tech_entry = self._tech_entry
+                _format_timestamp(now, into=tech_entry["timestamp"])
+                tech_entry["participant_id"] = self.participant_id or 'unknown'
+                tech_entry["level"] = level
+                tech_entry["message"] = message
+                tech_entry["screen"] = current_screen
+                tech_entry["session_duration_seconds"] = now - self._session_start_unix
+                # Queue without printing to avoid infinite recursion with console capture
+                self._queue_log_line(self.tech_log_file_path, _dumps(tech_entry))
 
         except Exception as e:
             # Fallback to original stdout to avoid infinite recursion
@@ -257,6 +416,124 @@ class LoggingManager:
             except:
                 pass  # Last resort - do nothing to avoid crash
 
+    def _open_log_file(self, path, truncate=False):
+        """Open path for binary appends with a large write buffer and cache the handle."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        if truncate:
+            flags |= os.O_TRUNC
+        with self._write_lock:
+            old = self._log_files.pop(path, None)
+            if old is not None:
+                old.close()
+            fd = os.open(path, flags, 0o644)
+            f = io.BufferedWriter(io.FileIO(fd, 'ab', closefd=True), buffer_size=1 << 16)
+            self._log_files[path] = f
+            return f
+
+    def _queue_log_line(self, path, line):
+        """Buffer one serialized JSONL line (bytes) for path; the writer thread writes it."""
+        with self._log_lock:
+            pending = self._log_buffers.get(path)
+            if pending is None:
+                maxlen = LOG_QUEUE_MAX_ENTRIES if path == self.tech_log_file_path else None
+                pending = self._log_buffers[path] = deque(maxlen=maxlen)
+            elif len(pending) == pending.maxlen:
+                self._dropped_lines += 1  # append() below evicts the oldest line
+            pending.append(line)
+            if self._log_writer is None:
+                self._log_writer = threading.Thread(target=self._log_writer_loop, name="log-writer", daemon=True)
+                self._log_writer.start()
+            if len(pending) >= LOG_FLUSH_MAX_ENTRIES:
+                self._log_wakeup.set()
+
+    def _log_writer_loop(self):
+        """Background writer: flush every LOG_FLUSH_INTERVAL, or sooner when a buffer fills up."""
+        while True:
+            self._log_wakeup.wait(LOG_FLUSH_INTERVAL)
+            self._log_wakeup.clear()
+            self.flush_logs()
+
+    def flush_logs(self, sync=False):
+        """Write all buffered log lines to disk (fsync as well if sync=True)."""
+        with self._write_lock:
+            # Take the pending lines and release _log_lock before writing
+            with self._log_lock:
+                batches = [(path, b'\n'.join(pending) + b'\n')
+                           for path, pending in self._log_buffers.items() if pending]
+                for pending in self._log_buffers.values():
+                    pending.clear()
+                dropped, self._dropped_lines = self._dropped_lines, 0
+            
+            if dropped:
+                try:
+                    self.original_stdout.write(f"⚠️ Warning: Log buffer full, dropped {dropped} oldest tech log lines\n")
+                except:
+                    pass
+            
+            for path, data in batches:
+                try:
+                    f = self._log_files.get(path)
+                    if f is None:
+                        f = self._open_log_file(path)
+                    f.write(data)
+                    f.flush()
+                    if sync:
+                        os.fsync(f.fileno())
+                except Exception as e:
+                    # Use original stdout to avoid recursion through console capture
+                    try:
+                        self.original_stdout.write(f"⚠️ Warning: Could not write log file {path}: {e}\n")
+                        self.original_stdout.flush()
+                    except:
+                        pass
+
+    def prepare_crash_record(self):
+        """Open the action log and pre-encode the crash record used by write_crash_record.
+        
+        Called whenever action_log_file_path is (re)assigned so that the crash
+        path never has to open files or run the JSON encoder.
+        """
+        if self._crash_fd is not None:
+            try:
+                os.close(self._crash_fd)
+            except OSError:
+                pass
+            self._crash_fd = None
+        
+        if not self.action_log_file_path:
+            return
+        
+        try:
+            self._crash_fd = os.open(self.action_log_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._crash_record_prefix = (
+                '{"participant_id": %s, "action_type": "APPLICATION_CRASH", '
+                % json.dumps(self.participant_id or 'UNKNOWN')
+            ).encode('utf-8')
+        except OSError as e:
+            print(f"⚠️ Warning: Could not prepare crash record: {e}")
+    
+    def set_crash_screen(self, screen_name):
+        """Pre-encode the screen name the crash record reports."""
+        self._crash_screen = json.dumps(screen_name).encode('utf-8')
+    
+    def write_crash_record(self, signum):
+        """Append a minimal crash record to the action log using only os.write().
+        
+        Runs in signal context, so it takes no locks and does no JSON encoding:
+        entries still buffered for the writer thread are not flushed, since the
+        interrupted thread may hold the buffer locks.
+        """
+        if self._crash_fd is None:
+            return
+        
+        t = time.time()
+        record = b'%s"details": "Application crashed with signal %d", "screen": %s, "timestamp": {"local": "%s", "unix": %.6f}}\n' % (
+            self._crash_record_prefix, signum, self._crash_screen,
+            time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t)).encode('ascii'), t
+        )
+        os.write(self._crash_fd, record)
+        os.fsync(self._crash_fd)
+
     def tech_print(self, message, level="INFO", current_screen="unknown"):
         """Print message to console and log it to tech log file."""
         # Print to console
@@ -267,9 +544,7 @@ class LoggingManager:
 
     def log_sentence_completion(self, sentence):
         """Log when user completes a sentence using the action logging system."""
-        from config import DESCRIPTIVE_LINE_LOGGING
-        
-        if not DESCRIPTIVE_LINE_LOGGING:
+        if not self.line_logging_enabled:
             return
 
         try:
@@ -277,47 +552,38 @@ class LoggingManager:
             sentence_clean = sentence.strip()
             details = {
                 "sentence": sentence_clean,
-                "word_count": len(sentence_clean.split()),
+                "word_count": count_words(sentence_clean),
                 "character_count": len(sentence_clean)
             }
 
-            self.log_action("SENTENCE_COMPLETED", json.dumps(details))
-            print(f"📝 Sentence logged: {sentence_clean[:50]}...")
+            self.log_action("SENTENCE_COMPLETED", details)
+            dprint(f"📝 Sentence logged: {sentence_clean[:50]}...")
         except Exception as e:
             print(f"⚠️ Warning: Could not log sentence: {e}")
 
     def add_task_selection_to_session_info(self, task_name, selection_mode, distribution_stats):
         """Add task selection metadata to session_info file."""
         try:
-            if not hasattr(self, 'session_info_file_path'):
+            if not self.session_info_file_path:
                 return
+            
+            from task_manager import TASK_DESCRIPTIONS  # task_manager imports this module
                 
-            # Read existing session info
-            with open(self.session_info_file_path, 'r') as f:
-                session_info = json.load(f)
+            session_info = self._load_session_info()
             
             # Add task selection metadata
             session_info["task_selection"] = {
                 "selected_task": task_name,
                 "selection_mode": selection_mode,
-                "task_description": {
-                    "mandala": "drawing your figure",
-                    "diary": "journal down your mind", 
-                    "mindfulness": "watch a fun video"
-                }.get(task_name, "unknown task"),
-                "selection_timestamp": {
-                    "local": datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "utc": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "unix_timestamp": time.time()
-                },
+                "task_description": TASK_DESCRIPTIONS.get(task_name, "unknown task"),
+                "selection_timestamp": _format_timestamp(time.time(), "unix_timestamp"),
                 "task_distribution_at_selection": distribution_stats
             }
             
             # Save updated session info
-            with open(self.session_info_file_path, 'w') as f:
-                json.dump(session_info, f, indent=2)
+            self._write_session_info()
                 
-            print(f"📋 Task selection added to session info: {task_name} ({selection_mode})")
+            dprint(f"📋 Task selection added to session info: {task_name} ({selection_mode})")
             
         except Exception as e:
             print(f"⚠️ Error adding task selection to session info: {e}")
@@ -353,29 +619,29 @@ class LoggingManager:
         try:
             # Disable console capture before finalizing
             self.disable_console_capture()
+            self.flush_partial_text()
+            self.flush_logs(sync=True)
             
-            if not hasattr(self, 'session_info_file_path'):
+            if not self.session_info_file_path:
                 return
 
-            # Read existing session info
-            with open(self.session_info_file_path, 'r') as f:
-                session_info = json.load(f)
+            session_info = self._load_session_info()
 
             # Add session end information
-            now = datetime.now()
-            session_info["session_end_time"] = {
-                "local": now.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                "utc": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                "unix_timestamp": time.time()
-            }
-            session_info["session_duration_seconds"] = (now - self.session_start_time).total_seconds()
+            now = time.time()
+            session_info["session_end_time"] = _format_timestamp(now, "unix_timestamp")
+            session_info["session_duration_seconds"] = now - self._session_start_unix
             session_info["session_duration_minutes"] = session_info["session_duration_seconds"] / 60
 
             # Write updated session info
-            with open(self.session_info_file_path, 'w') as f:
-                json.dump(session_info, f, indent=2)
+            self._write_session_info()
 
-            print(f"📋 Session finalized: {session_info['session_duration_minutes']:.2f} minutes")
+            dprint(f"📋 Session finalized: {session_info['session_duration_minutes']:.2f} minutes")
+
+            try:
+                os.unlink(INCOMPLETE_SESSION_MARKER)
+            except FileNotFoundError:
+                pass
         except Exception as e:
             print(f"⚠️ Warning: Could not finalize session: {e}")
 
@@ -403,44 +669,71 @@ class LoggingManager:
         self.log_action(event_type, action_details, current_screen)
 
     def log_partial_text(self, text_content, countdown_remaining=None, current_prompt_index=0):
-        """Log partial text content for crash recovery."""
+        """Log partial text content for crash recovery.
+        
+        Calls are debounced: only the latest snapshot is written, at most once
+        every PARTIAL_TEXT_DEBOUNCE seconds.
+        """
         if not self.action_log_file_path:
             return
 
+        with self._log_lock:
+            # Never drop the final snapshot of a previous prompt
+            pending = self._pending_partial
+            if pending is not None and pending[3] != current_prompt_index:
+                self.flush_partial_text()
+            
+            self._pending_partial = (time.time(), text_content, countdown_remaining, current_prompt_index)
+            if self._partial_timer is None:
+                self._partial_timer = threading.Timer(PARTIAL_TEXT_DEBOUNCE, self.flush_partial_text)
+                self._partial_timer.daemon = True
+                self._partial_timer.start()
+
+    def flush_partial_text(self):
+        """Write the pending partial text snapshot, if any."""
+        with self._log_lock:
+            if self._partial_timer is not None:
+                self._partial_timer.cancel()
+                self._partial_timer = None
+            pending = self._pending_partial
+            self._pending_partial = None
+        
+        if pending is None:
+            return
+        
         try:
+            now, text_content, countdown_remaining, current_prompt_index = pending
             partial_data = {
-                "timestamp": {
-                    "local": datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "utc": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    "unix": time.time()
-                },
+                "timestamp": _format_timestamp(now),
                 "participant_id": self.participant_id,
                 "action_type": "PARTIAL_TEXT_UPDATE",
                 "details": {
                     "text_content": text_content,
                     "text_length": len(text_content),
-                    "word_count": len(text_content.split()) if text_content else 0,
+                    "word_count": count_words(text_content),
                     "current_prompt_index": current_prompt_index,
                     "countdown_remaining": countdown_remaining
                 },
                 "screen": "descriptive_task",
-                "session_duration_seconds": (datetime.now() - self.session_start_time).total_seconds()
+                "session_duration_seconds": now - self._session_start_unix
             }
 
-            with open(self.action_log_file_path, 'a') as f:
-                f.write(json.dumps(partial_data) + '\n')
+            self._queue_log_line(self.action_log_file_path, _dumps(partial_data))
 
         except Exception as e:
             print(f"⚠️ Error logging partial text: {e}")
 
     def log_countdown_state(self, countdown_remaining, countdown_total, current_screen="unknown"):
         """Log countdown timer state for recovery."""
+        if not self.countdown_enabled or countdown_remaining == self._last_logged_countdown:
+            return
+        self._last_logged_countdown = countdown_remaining
         countdown_data = {
             "remaining_seconds": countdown_remaining,
             "total_seconds": countdown_total,
             "percentage_complete": ((countdown_total - countdown_remaining) / countdown_total * 100) if countdown_total > 0 else 0
         }
-        self.log_action("COUNTDOWN_STATE", json.dumps(countdown_data), current_screen)
+        self.log_action("COUNTDOWN_STATE", countdown_data, current_screen)
 
     # Enhanced helper methods for comprehensive logging
     
@@ -1,9 +1,78 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import json
-import glob
+import mmap
 from datetime import datetime
+from logging_manager import INCOMPLETE_SESSION_MARKER
+
+# orjson is optional; both parsers accept bytes, so lines are never decoded first
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Action type markers identifying the survey a webpage screen was showing
+_SURVEY_MARKERS = (
+    ('PRESTUDY', 'prestudy'),
+    ('DURINGSTUDY1', 'duringstudy1'),
+    ('DURINGSTUDY2', 'duringstudy2'),
+    ('POSTSTUDY', 'poststudy')
+)
+
+# Words in TRANSITION_SCREEN_DISPLAYED details identifying the upcoming task
+_TRANSITION_MARKERS = (
+    ('descriptive', 'descriptive_transition'),
+    ('stroop', 'stroop_transition'),
+    ('math', 'math_transition')
+)
+
+# Logged screen names that map straight to a recovery screen
+_DIRECT_RECOVERY_SCREENS = {
+    'relaxation': 'relaxation',
+    'stroop': 'stroop',
+    'nativestroop': 'stroop',
+    'math_task': 'math_task',
+    'mathtask': 'math_task',
+    'post_study_rest': 'post_study_rest',
+    'poststudyrest': 'post_study_rest',
+    'content_performance': 'content_performance',
+    'contentperformance': 'content_performance',
+    'consent': 'consent',
+    'participant_id': 'participant_id',
+    'participantid': 'participant_id'
+}
+
+
+def _tail_lines(path):
+    """Yield the non-empty lines (bytes) of a file newest-first.
+    
+    The file is memory-mapped and scanned backwards with rfind, so only the
+    pages holding the lines actually consumed are read, without copying
+    fixed-size chunks and stitching lines across chunk boundaries.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0:
+                start = mm.rfind(b'\n', 0, end) + 1
+                line = mm[start:end]
+                if line.strip():
+                    yield line
+                end = start - 1
+
+
+_SESSION_TS_RE = re.compile(r'^session_info_(.+)\.json$')
+
+
+def _session_timestamp(session_info_path):
+    """Return the timestamp suffix shared by all log files of a session ('' if the name doesn't match)."""
+    match = _SESSION_TS_RE.match(os.path.basename(session_info_path))
+    return match.group(1) if match else ''
 
 
 class RecoveryManager:
@@ -16,17 +85,21 @@ class RecoveryManager:
     
     def check_for_incomplete_sessions(self):
         """Check for incomplete sessions that can be recovered."""
-        if not os.path.exists("logs"):
+        # No marker means the last session was finalized cleanly
+        if not os.path.exists(INCOMPLETE_SESSION_MARKER):
             return None
 
-        incomplete_sessions = []
-        for participant_dir in os.listdir("logs"):
-            participant_path = os.path.join("logs", participant_dir)
-            if not os.path.isdir(participant_path):
-                continue
-
+        latest_session = None
+        # scandir reports the entry type from the directory listing itself, so
+        # no per-entry stat() is needed (unlike listdir + isdir)
+        with os.scandir("logs") as participant_entries:
+            participant_paths = [entry.path for entry in participant_entries if entry.is_dir()]
+        
+        for participant_path in participant_paths:
             # Check each session for this participant
-            session_files = glob.glob(os.path.join(participant_path, "session_info_*.json"))
+            with os.scandir(participant_path) as session_entries:
+                session_files = [entry.path for entry in session_entries
+                                 if entry.name.startswith("session_info_") and entry.name.endswith(".json")]
             for session_file in session_files:
                 try:
                     with open(session_file, 'r') as f:
@@ -34,69 +107,68 @@ class RecoveryManager:
 
                     # If session doesn't have an end time, it's incomplete
                     if 'session_end_time' not in session_info:
-                        recovery_data = self.analyze_incomplete_session(session_file)
-                        if recovery_data:
-                            incomplete_sessions.append(recovery_data)
+                        recovery_data = self.analyze_incomplete_session(session_file, session_info)
+                        # Keep only the most recent incomplete session alive
+                        if recovery_data and (latest_session is None or
+                                recovery_data['session_start_unix'] > latest_session['session_start_unix']):
+                            latest_session = recovery_data
                 except Exception as e:
                     print(f"Error checking session {session_file}: {e}")
 
         # Return the most recent incomplete session
-        if incomplete_sessions:
-            return max(incomplete_sessions, key=lambda x: x['session_start_unix'])
-        return None
+        return latest_session
 
-    def analyze_incomplete_session(self, session_info_path):
+    def analyze_incomplete_session(self, session_info_path, session_info=None):
         """Analyze an incomplete session to determine recovery state."""
         try:
-            with open(session_info_path, 'r') as f:
-                session_info = json.load(f)
+            if session_info is None:
+                with open(session_info_path, 'r') as f:
+                    session_info = json.load(f)
 
             participant_id = session_info['participant_id']
             session_dir = os.path.dirname(session_info_path)
 
-            # Load actions to determine last state
-            actions_pattern = os.path.join(session_dir, "actions_*.jsonl")
-            actions_files = glob.glob(actions_pattern)
-            if not actions_files:
+            # All log files of a session share the session_info timestamp
+            timestamp = _session_timestamp(session_info_path)
+            if not timestamp:
                 return None
 
-            actions = []
-            with open(actions_files[0], 'r') as f:
-                for line in f:
-                    if line.strip():
-                        actions.append(json.loads(line))
+            # Load actions to determine last state
+            actions_path = os.path.join(session_dir, f"actions_{timestamp}.jsonl")
+            if not os.path.exists(actions_path):
+                return None
 
-            # Sort actions by timestamp
-            actions.sort(key=lambda x: x['timestamp']['unix'])
+            summary = self.read_recent_actions(actions_path)
 
-            if not actions:
+            if not summary:
                 return None
 
-            last_action = actions[-1]
+            last_action = summary['last_action']
             last_screen = last_action['screen']
 
             # Load descriptive responses if any
-            responses_pattern = os.path.join(session_dir, "descriptive_responses_*.jsonl")
-            responses_files = glob.glob(responses_pattern)
+            responses_path = os.path.join(session_dir, f"descriptive_responses_{timestamp}.jsonl")
             responses = []
-            if responses_files:
-                with open(responses_files[0], 'r') as f:
+            if os.path.exists(responses_path):
+                with open(responses_path, 'rb', buffering=1 << 20) as f:
                     for line in f:
                         if line.strip():
-                            responses.append(json.loads(line))
+                            responses.append(_loads(line))
 
             # Determine recovery state
-            recovery_state = self.determine_recovery_state(actions, responses, last_screen)
+            recovery_state = self.determine_recovery_state(summary, responses, last_screen)
 
             return {
                 'participant_id': participant_id,
                 'session_start_unix': session_info['session_start_time']['unix_timestamp'],
                 'session_info_path': session_info_path,
                 'session_dir': session_dir,
+                'timestamp': timestamp,
                 'last_screen': last_screen,
                 'last_action': last_action,
                 'recovery_state': recovery_state,
-                'actions': actions,
+                'partial_by_prompt': summary['partial_by_prompt'],
+                'last_countdown_state': summary['last_countdown_state'],
                 'responses': responses,
                 'session_info': session_info
             }
@@ -105,76 +177,97 @@ class RecoveryManager:
             print(f"Error analyzing incomplete session: {e}")
             return None
 
-    def determine_recovery_state(self, actions, responses, last_screen):
-        """Determine what state to recover to based on actions."""
-        print(f"🔍 Determining recovery state for last_screen: {last_screen}")
+    def read_recent_actions(self, actions_path):
+        """Summarize the actions logged since the most recent screen transition.
+        
+        Everything recovery needs (last screen, survey/transition markers,
+        partial text) is logged after the switch into the last screen, so the
+        file is read backwards in a single streaming pass that stops at that
+        SCREEN_TRANSITION. Only aggregates are kept: the newest action, the
+        newest PARTIAL_TEXT_UPDATE details per prompt, the newest COUNTDOWN_STATE
+        details, and the survey and transition screens named by the newest
+        matching actions.
+        Returns None if nothing was logged.
+        """
+        last_action = None
+        partial_by_prompt = {}
+        last_countdown_state = None
+        survey_screen = None
+        transition_screen = None
+        for line in _tail_lines(actions_path):
+            action = _loads(line)
+            action_type = action.get('action_type', '')
+            if last_action is None or action['timestamp']['unix'] > last_action['timestamp']['unix']:
+                last_action = action
+            
+            if action_type == 'PARTIAL_TEXT_UPDATE':
+                details = action.get('details', {})
+                if isinstance(details, dict):
+                    # Lines arrive newest-first, so the first snapshot per prompt wins
+                    partial_by_prompt.setdefault(details.get('current_prompt_index', 0), details)
+            else:
+                if action_type == 'COUNTDOWN_STATE' and last_countdown_state is None:
+                    details = action.get('details', {})
+                    if isinstance(details, str):
+                        # Older logs stored the details as a JSON string
+                        try:
+                            details = _loads(details)
+                        except ValueError:
+                            details = None
+                    if isinstance(details, dict):
+                        last_countdown_state = details
+                if survey_screen is None:
+                    for marker, screen in _SURVEY_MARKERS:
+                        if marker in action_type:
+                            survey_screen = screen
+                            break
+                if transition_screen is None and action_type == 'TRANSITION_SCREEN_DISPLAYED':
+                    details = action.get('details', '')
+                    details = details.lower() if isinstance(details, str) else ''
+                    for marker, screen in _TRANSITION_MARKERS:
+                        if marker in details:
+                            transition_screen = screen
+                            break
+            
+            if action_type == 'SCREEN_TRANSITION':
+                break
+        
+        if last_action is None:
+            return None
         
+        return {
+            'last_action': last_action,
+            'partial_by_prompt': partial_by_prompt,
+            'last_countdown_state': last_countdown_state,
+            'survey_screen': survey_screen,
+            'transition_screen': transition_screen
+        }
+
+    def determine_recovery_state(self, summary, responses, last_screen):
+        """Determine what state to recover to based on the summary from read_recent_actions."""
+        print(f"🔍 Determining recovery state for last_screen: {last_screen}")
+
         # Check if user was in descriptive task
         if last_screen in ["descriptive_task", "descriptivetask"]:
-            # Find current prompt index
-            screen_displayed_actions = [a for a in actions if a['action_type'] == 'SCREEN_DISPLAYED' and a['screen'] in ['descriptive_task', 'descriptivetask']]
-            if screen_displayed_actions:
-                # Count how many prompts were completed
-                current_prompt_index = len(responses)
-                return {
-                    'screen': 'descriptive_task',
-                    'current_prompt_index': current_prompt_index,
-                    'completed_responses': responses
-                }
-            else:
-                # If no screen displayed actions, still return descriptive task
-                return {
-                    'screen': 'descriptive_task',
-                    'current_prompt_index': 0,
-                    'completed_responses': responses
-                }
-
-        # Check other task screens
-        elif last_screen == "relaxation":
-            return {'screen': 'relaxation'}
-        elif last_screen in ["stroop", "nativestroop"]:
-            return {'screen': 'stroop'}
-        elif last_screen in ["math_task", "mathtask"]:
-            return {'screen': 'math_task'}
-        elif last_screen in ["post_study_rest", "poststudyrest"]:
-            return {'screen': 'post_study_rest'}
-        elif last_screen in ["content_performance", "contentperformance"]:
-            return {'screen': 'content_performance'}
+            # The current prompt follows the completed ones
+            return {
+                'screen': 'descriptive_task',
+                'current_prompt_index': len(responses),
+                'completed_responses': responses
+            }
+
+        # Screens that are resumed directly, without inspecting actions
+        elif last_screen in _DIRECT_RECOVERY_SCREENS:
+            return {'screen': _DIRECT_RECOVERY_SCREENS[last_screen]}
         
         # Check if user was in a survey/webpage screen
         elif last_screen == "webpage":
             # Determine which survey they were on based on recent actions
-            for action in reversed(actions):
-                if 'PRESTUDY' in action.get('action_type', ''):
-                    return {'screen': 'prestudy'}
-                elif 'DURINGSTUDY1' in action.get('action_type', ''):
-                    return {'screen': 'duringstudy1'}
-                elif 'DURINGSTUDY2' in action.get('action_type', ''):
-                    return {'screen': 'duringstudy2'}
-                elif 'POSTSTUDY' in action.get('action_type', ''):
-                    return {'screen': 'poststudy'}
-            return {'screen': 'prestudy'}  # Default to first survey
-        
-        # Check consent screen
-        elif last_screen == "consent":
-            return {'screen': 'consent'}
+            return {'screen': summary['survey_screen'] or 'prestudy'}  # Default to first survey
         
         # Check transition screens - look at what they were transitioning to
         elif last_screen == "transition":
-            for action in reversed(actions):
-                if action.get('action_type') == 'TRANSITION_SCREEN_DISPLAYED':
-                    details = action.get('details', '')
-                    if 'descriptive' in details.lower():
-                        return {'screen': 'descriptive_transition'}
-                    elif 'stroop' in details.lower():
-                        return {'screen': 'stroop_transition'}
-                    elif 'math' in details.lower():
-                        return {'screen': 'math_transition'}
-            return {'screen': 'descriptive_transition'}  # Default transition
-        
-        # Participant ID screen
-        elif last_screen in ["participant_id", "participantid"]:
-            return {'screen': 'participant_id'}
+            return {'screen': summary['transition_screen'] or 'descriptive_transition'}  # Default transition
 
         # Default to beginning if unsure
         print(f"⚠️ Unknown screen type: {last_screen}, defaulting to participant_id")
@@ -189,9 +282,10 @@ class RecoveryManager:
         self.logging_manager.session_info_file_path = recovery_data['session_info_path']
 
         # Set up log file paths (reuse existing files)
-        timestamp = os.path.basename(recovery_data['session_info_path']).replace('session_info_', '').replace('.json', '')
+        timestamp = recovery_data['timestamp']
         self.logging_manager.action_log_file_path = os.path.join(self.logging_manager.log_dir, f"actions_{timestamp}.jsonl")
         self.logging_manager.descriptive_response_file_path = os.path.join(self.logging_manager.log_dir, f"descriptive_responses_{timestamp}.jsonl")
+        self.logging_manager.prepare_crash_record()
 
         # Set session start time to original session start time for proper duration calculation
         original_start = recovery_data['session_info']['session_start_time']['unix_timestamp']
@@ -203,8 +297,10 @@ class RecoveryManager:
         self.recovery_data = recovery_data
 
         # Log app reopening and recovery
-        self.logging_manager.log_action("APPLICATION_REOPENED", f"Application reopened after crash, resuming from {recovery_data['last_screen']} screen")
-        self.logging_manager.log_action("SESSION_RESUMED", f"Resumed session from {recovery_data['last_screen']} screen")
+        self.logging_manager.log_actions_batch([
+            ("APPLICATION_REOPENED", f"Application reopened after crash, resuming from {recovery_data['last_screen']} screen"),
+            ("SESSION_RESUMED", f"Resumed session from {recovery_data['last_screen']} screen")
+        ])
 
     def restore_text_and_countdown(self, response_text_widget, update_word_count_callback, 
                                  countdown_manager, countdown_enabled):
@@ -212,30 +308,19 @@ class RecoveryManager:
         if not self.recovery_data or not response_text_widget:
             return
 
-        # Look for the most recent partial text update for current prompt
-        actions = self.recovery_data.get('actions', [])
         partial_text = ""
         countdown_remaining = None
 
         # Find the most recent partial text update for the current prompt
         current_prompt = 0  # This should be passed as parameter if needed
 
-        for action in reversed(actions):  # Start from most recent
-            if action.get('action_type') == 'PARTIAL_TEXT_UPDATE':
-                details = action.get('details', {})
-                if isinstance(details, dict):
-                    action_prompt = details.get('current_prompt_index', 0)
-                    if action_prompt == current_prompt:
-                        partial_text = details.get('text_content', '')
-                        countdown_remaining = details.get('countdown_remaining')
-                        break
-            elif action.get('action_type') == 'COUNTDOWN_STATE':
-                try:
-                    countdown_data = json.loads(action.get('details', '{}'))
-                    if countdown_remaining is None:  # Only use if we haven't found one yet
-                        countdown_remaining = countdown_data.get('remaining_seconds')
-                except:
-                    pass
+        details = self.recovery_data.get('partial_by_prompt', {}).get(current_prompt)
+        if details:
+            partial_text = details.get('text_content', '')
+            countdown_remaining = details.get('countdown_remaining')
+        elif self.recovery_data.get('last_countdown_state'):
+            # Fall back to the most recent countdown state
+            countdown_remaining = self.recovery_data['last_countdown_state'].get('remaining_seconds')
 
         # Restore the text if found
         if partial_text:
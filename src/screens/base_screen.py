@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayo
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QPalette, QKeySequence, QShortcut
 from abc import ABC, ABCMeta, abstractmethod
+from logging_manager import dprint
 
 
 class CombinedMeta(type(QWidget), ABCMeta):
@@ -34,6 +35,7 @@ class BaseScreen(QWidget, ABC, metaclass=CombinedMeta):
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
         self.widgets = []
+        self.shortcuts = {}  # QShortcuts created by bind_key by key sequence, released in hide()
         self.is_active = False
         
         # Set default styling
@@ -50,14 +52,20 @@ class BaseScreen(QWidget, ABC, metaclass=CombinedMeta):
             print(f"🖥️ Setting up {self.screen_name} screen")
             
             # Setup this screen if not already done
-            print(f"🔍 Checking if setup is done: {hasattr(self, '_screen_setup_done')}")
+            dprint(f"🔍 Checking if setup is done: {hasattr(self, '_screen_setup_done')}")
             if not hasattr(self, '_screen_setup_done'):
-                print(f"🔍 Setting up {self.screen_name} screen...")
-                self.setup_screen()
+                dprint(f"🔍 Setting up {self.screen_name} screen...")
+                # Suspend painting while widgets are created and laid out, so
+                # the screen is laid out and painted once instead of per widget
+                self.setUpdatesEnabled(False)
+                try:
+                    self.setup_screen()
+                finally:
+                    self.setUpdatesEnabled(True)
                 self._screen_setup_done = True
-                print(f"🔍 Setup completed for {self.screen_name} screen")
+                dprint(f"🔍 Setup completed for {self.screen_name} screen")
             else:
-                print(f"🔍 {self.screen_name} screen already set up")
+                dprint(f"🔍 {self.screen_name} screen already set up")
             
             # Don't call super().show() - let main app handle visibility
             # The stacked widget will handle showing the widget
@@ -85,23 +93,25 @@ class BaseScreen(QWidget, ABC, metaclass=CombinedMeta):
             # Hide this widget
             super().hide()
             
-            # Cleanup widgets
+            # Cleanup widgets. Qt deletes children together with their parent, so
+            # only tracked widgets whose parent is not itself tracked are deleted.
+            tracked = {id(widget) for widget in self.widgets}
             for widget in self.widgets:
                 try:
-                    widget.deleteLater()
+                    if id(widget.parentWidget()) not in tracked:
+                        widget.deleteLater()
                 except:
                     pass
             self.widgets.clear()
             
             # Cleanup shortcuts
-            if hasattr(self, 'shortcuts'):
-                for shortcut in self.shortcuts:
-                    try:
-                        shortcut.setEnabled(False)
-                        shortcut.deleteLater()
-                    except:
-                        pass
-                self.shortcuts.clear()
+            for shortcut in self.shortcuts.values():
+                try:
+                    shortcut.setEnabled(False)
+                    shortcut.deleteLater()
+                except:
+                    pass
+            self.shortcuts.clear()
             
         except Exception as e:
             print(f"⚠️ Error hiding {self.screen_name} screen: {e}")
@@ -184,15 +194,18 @@ class BaseScreen(QWidget, ABC, metaclass=CombinedMeta):
                 # Try to parse other key sequences
                 qt_key = QKeySequence(key_sequence.replace('<', '').replace('>', ''))
             
-            # Create QShortcut for key binding
-            shortcut = QShortcut(qt_key, self)
+            # Reuse the shortcut if this key is already bound on the screen: a
+            # second QShortcut for the same key would be ambiguous and pile up
+            key = qt_key.toString()
+            shortcut = self.shortcuts.get(key)
+            if shortcut is None:
+                shortcut = QShortcut(qt_key, self)
+                # Store shortcut reference for cleanup
+                self.shortcuts[key] = shortcut
+            else:
+                shortcut.activated.disconnect()  # Rebinding replaces the previous handler
             shortcut.activated.connect(callback)
             
-            # Store shortcut reference for cleanup
-            if not hasattr(self, 'shortcuts'):
-                self.shortcuts = []
-            self.shortcuts.append(shortcut)
-            
         except Exception as e:
             print(f"⚠️ Error binding key {key_sequence}: {e}")
             # Fallback - store in main app shortcuts if available
@@ -6,6 +6,15 @@ from PyQt6.QtGui import QValidator
 from .base_screen import BaseScreen
 
 
+class ParticipantIDValidator(QValidator):
+    """Accept only letters, digits, underscores and hyphens."""
+
+    def validate(self, text, pos):
+        if all(c.isalnum() or c in '_-' for c in text):
+            return QValidator.State.Acceptable, text.upper(), pos
+        return QValidator.State.Invalid, text, pos
+
+
 class ParticipantIDScreen(BaseScreen):
     """Screen for participant ID entry."""
     
@@ -65,16 +74,10 @@ class ParticipantIDScreen(BaseScreen):
             }}
         """)
         
-        # Create custom validator for participant ID
-        class ParticipantIDValidator(QValidator):
-            def validate(self, text, pos):
-                if all(c.isalnum() or c in ['_', '-'] for c in text):
-                    return QValidator.State.Acceptable, text.upper(), pos
-                return QValidator.State.Invalid, text, pos
-        
         self.participant_id_entry.setValidator(ParticipantIDValidator())
-        self.participant_id_entry.textChanged.connect(lambda text: self.participant_id_entry.setText(text.upper()))
-        self.participant_id_entry.textChanged.connect(self.log_text_change)
+        self.participant_id_entry.textChanged.connect(self.uppercase_text)
+        # textEdited only fires for user edits, not for the uppercasing setText
+        self.participant_id_entry.textEdited.connect(self.log_text_change)
         self.participant_id_entry.returnPressed.connect(self.submit_participant_id)
         
         # Center the entry widget
@@ -116,6 +119,17 @@ class ParticipantIDScreen(BaseScreen):
         # Log screen display
         self.log_action("PARTICIPANT_ID_SCREEN_DISPLAYED", "Participant ID entry screen shown")
     
+    def hide(self):
+        """Hide the screen and drop the reference to the deleted entry widget."""
+        super().hide()
+        self.participant_id_entry = None
+    
+    def uppercase_text(self, text):
+        """Uppercase the entry only when needed, so setText doesn't re-emit textChanged per key."""
+        upper_text = text.upper()
+        if text != upper_text:
+            self.participant_id_entry.setText(upper_text)
+    
     def log_text_change(self, text):
         """Log participant ID text changes."""
         if text.strip():  # Only log non-empty text
@@ -1,13 +1,54 @@
 #!/usr/bin/env python3
 
-from PyQt6.QtWidgets import QLabel, QVBoxLayout, QHBoxLayout, QFrame, QTextEdit, QScrollArea, QSizePolicy
+from PyQt6.QtWidgets import QLabel, QVBoxLayout, QHBoxLayout, QFrame, QTextEdit, QScrollArea, QSizePolicy, QPushButton
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QPixmap, QPainter
 import os
-import cv2
 import random
+import time
+import traceback
 from .base_screen import BaseScreen
 from countdown_widget import CountdownWidget
+from logging_manager import count_words
+from video_manager import VideoFrameLabel
+
+# Typing pause (ms) after which the descriptive word count is refreshed and logged
+TEXT_SETTLE_MS = 150
+
+# DESCRIPTIVE_TEXT_PROGRESS is logged each time the word count grows by this much
+PROGRESS_LOG_WORDS = 10
+
+# Completed sentences are looked for in at most this many trailing characters
+SENTENCE_SCAN_CHARS = 512
+
+
+def _last_sentence(text):
+    """Return the sentence that ends text, or '' if there is none."""
+    tail = text[-SENTENCE_SCAN_CHARS:]
+    end = len(tail) - 1  # Skip the terminator that ends this sentence
+    start = max(tail.rfind('.', 0, end), tail.rfind('!', 0, end), tail.rfind('?', 0, end)) + 1
+    sentence = tail[start:].strip()
+    return sentence if len(sentence) > 1 else ''
+
+
+# Style for the self-selection task buttons, set once on their container
+_TASK_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: 2px solid #45a049;
+        border-radius: 10px;
+        padding: 15px;
+        margin: 5px;
+        text-align: center;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+"""
 
 
 class TransitionScreen(BaseScreen):
@@ -198,7 +239,7 @@ class RelaxationScreen(BaseScreen):
         text_font_size = max(32, min(96, int(screen_width * 0.05)))
         
         # Setup video display area - responsive sizing
-        self.video_widget = QLabel()
+        self.video_widget = VideoFrameLabel()
         try:
             from config import COLORS, UI_SETTINGS
             border_color = COLORS['border_default']
@@ -332,6 +373,12 @@ class DescriptiveTaskScreen(BaseScreen):
         super().__init__(app_instance, logging_manager)
         self.response_text = None
         self.prompt_label = None
+        self._word_count = None
+        self._word_count_capped = False  # Paragraphs past max_response_chars left uncounted
+        self._text_settle_timer = None
+        self._response_dirty = False  # Set by edits, cleared once the response is saved
+        self._last_progress_words = 0  # Word count at the last DESCRIPTIVE_TEXT_PROGRESS entry
+        self._sentence_end = None  # Document position just past the last typed . ! or ?
         self.word_count_label = None
         self.descriptive_start_button = None
         self.corner_countdown_label = None
@@ -342,13 +389,14 @@ class DescriptiveTaskScreen(BaseScreen):
         try:
             from config import (BACKGROUND_COLOR, COLORS, COUNTDOWN_ENABLED, 
                               DESCRIPTIVE_COUNTDOWN_ENABLED, DESCRIPTIVE_COUNTDOWN_MINUTES,
-                              DESCRIPTIVE_PROMPTS, DEVELOPER_MODE)
+                              DESCRIPTIVE_PROMPTS, DEVELOPER_MODE, DESCRIPTIVE_LINE_LOGGING)
             self.background_color = BACKGROUND_COLOR
             self.colors = COLORS
             self.countdown_enabled = COUNTDOWN_ENABLED and DESCRIPTIVE_COUNTDOWN_ENABLED
             self.countdown_minutes = DESCRIPTIVE_COUNTDOWN_MINUTES
-            self.prompts = DESCRIPTIVE_PROMPTS.copy()
+            self.prompts = DESCRIPTIVE_PROMPTS
             self.developer_mode = DEVELOPER_MODE
+            self.line_logging = DESCRIPTIVE_LINE_LOGGING
         except ImportError:
             # Fallback values
             self.background_color = '#8B0000'
@@ -358,9 +406,16 @@ class DescriptiveTaskScreen(BaseScreen):
             self.countdown_minutes = 10
             self.prompts = ["Describe your current thoughts and feelings."]
             self.developer_mode = False
+            self.line_logging = True
+        # Newer setting, imported on its own so an older config.py keeps the rest
+        try:
+            from config import DESCRIPTIVE_MAX_RESPONSE_CHARS
+            self.max_response_chars = DESCRIPTIVE_MAX_RESPONSE_CHARS
+        except ImportError:
+            self.max_response_chars = 20000
+        self._num_prompts = len(self.prompts)
             
         # Select a random prompt instead of using index 0
-        import random
         self.current_prompt_index = random.randint(0, len(self.prompts) - 1) if self.prompts else 0
         print(f"🎯 DEBUG: Selected random prompt {self.current_prompt_index + 1}/{len(self.prompts)}: {self.prompts[self.current_prompt_index] if self.prompts else 'No prompts available'}")
         self.descriptive_font_size = 16
@@ -502,6 +557,14 @@ class DescriptiveTaskScreen(BaseScreen):
         self.word_count_label = QLabel("Word count: 0")
         self.word_count_label.setFont(QFont('Arial', word_count_font_size))
         self.word_count_label.setStyleSheet(f"color: {self.colors['text_accent']}; background-color: transparent; font-size: {word_count_font_size}px;")
+        # Fixed height and a minimum width that fits any count, so updating the
+        # text never changes the label's size and relayouts the whole screen;
+        # it still spans the row as before
+        self.word_count_label.ensurePolished()
+        self.word_count_label.setFixedHeight(self.word_count_label.sizeHint().height())
+        self.word_count_label.setMinimumWidth(
+            self.word_count_label.fontMetrics().horizontalAdvance("Word count: 00000")
+        )
         self.layout.addWidget(self.word_count_label)
         self.add_widget(self.word_count_label)
         self.layout.addStretch(1)
@@ -568,7 +631,7 @@ class DescriptiveTaskScreen(BaseScreen):
         self.response_text.setFocus()
         
         # Log task started
-        current_prompt = self.prompts[self.current_prompt_index] if self.current_prompt_index < len(self.prompts) else "No prompt available"
+        current_prompt = self.current_prompt_text("No prompt available")
         self.log_action("DESCRIPTIVE_TASK_STARTED", f"Task started with prompt: {current_prompt[:50]}...")
         
         # Start unified countdown if enabled
@@ -603,53 +666,138 @@ class DescriptiveTaskScreen(BaseScreen):
         self.save_current_response()
         self.transition_to_next_screen()
     
+    def current_prompt_text(self, fallback="Unknown prompt"):
+        """Return the current prompt, or fallback once the index is past the last prompt."""
+        index = self.current_prompt_index
+        return self.prompts[index] if index < self._num_prompts else fallback
+    
     def show_current_prompt(self):
         """Show current descriptive prompt."""
-        if self.current_prompt_index < len(self.prompts):
-            prompt = self.prompts[self.current_prompt_index]
-            self.prompt_label.setText(prompt)
-        else:
-            self.prompt_label.setText("Great job! You've completed all the descriptive tasks.")
+        self.prompt_label.setText(self.current_prompt_text("Great job! You've completed all the descriptive tasks."))
     
     def setup_word_count_tracking(self):
         """Set up word count tracking for the descriptive response text."""
-        def update_word_count(event=None):
-            try:
-                # Get text content
-                text_content = self.response_text.toPlainText()
-                # Remove trailing newline and split into words
-                words = text_content.strip().split()
-                # Filter out empty strings
-                word_count = len([word for word in words if word.strip()])
-                # Update the label
-                self.word_count_label.setText(f"Word count: {word_count}")
-            except:
-                # If there's any error, just show 0
-                self.word_count_label.setText("Word count: 0")
-        
-        # Connect to text change events in PyQt6
-        self.response_text.textChanged.connect(update_word_count)
-        self.response_text.textChanged.connect(self.log_text_activity)
+        # Each edit restarts a short single-shot timer, so a burst of typing
+        # is counted and logged once
+        self._text_settle_timer = QTimer(self)
+        self._text_settle_timer.setSingleShot(True)
+        self._text_settle_timer.setInterval(TEXT_SETTLE_MS)
+        self._text_settle_timer.timeout.connect(self.on_text_settled)
+        
+        # contentsChange is the only edit signal listened to: it fires once per
+        # actual buffer change (a paste is one call) with the edited range, so
+        # word counts cached per paragraph only need the touched ones recounted
+        self.response_text.document().contentsChange.connect(self.on_contents_change)
         
         # Initial word count
-        update_word_count()
+        self._word_count = None
+        self.update_word_count()
+    
+    def on_contents_change(self, position, chars_removed, chars_added):
+        """Recount the words of the paragraphs touched by an edit."""
+        # Runs on every keystroke: work on locals rather than attribute lookups
+        self._response_dirty = True
+        self._text_settle_timer.start()
+        document = self.response_text.document()
+        
+        # Remember a typed sentence terminator; it is logged once typing settles
+        if chars_added:
+            typed = document.characterAt(position + chars_added - 1)
+            if typed and typed in '.!?':
+                self._sentence_end = position + chars_added
+        
+        find_block = document.findBlock
+        block = find_block(position)
+        last_block = find_block(position + chars_added)
+        while block.isValid():
+            block.setUserState(count_words(block.text()))
+            if block == last_block:
+                break
+            block = block.next()
+    
+    def on_text_settled(self):
+        """Update the word count and log activity once typing pauses."""
+        self.update_word_count()
+        self.log_text_activity()
+        self.log_partial_text()
+    
+    def update_word_count(self):
+        """Count the words in the response and refresh the label if the count changed.
+        
+        Only paragraphs starting within the first max_response_chars characters
+        are counted, which bounds the work per pause; the label shows "N+" when
+        text beyond that is left uncounted. The response itself is never cut.
+        """
+        try:
+            # Sum the cached paragraph counts; log_text_activity reuses the result
+            word_count = 0
+            limit = self.max_response_chars
+            block = self.response_text.document().begin()
+            while block.isValid() and block.position() < limit:
+                block_words = block.userState()
+                if block_words < 0:
+                    # Not counted yet (user state defaults to -1)
+                    block_words = count_words(block.text())
+                    block.setUserState(block_words)
+                word_count += block_words
+                block = block.next()
+            capped = block.isValid()
+            if word_count != self._word_count or capped != self._word_count_capped:
+                self._word_count = word_count
+                self._word_count_capped = capped
+                self.word_count_label.setText(f"Word count: {word_count}{'+' if capped else ''}")
+        except:
+            # If there's any error, just show 0
+            self._word_count = 0
+            self._word_count_capped = False
+            self.word_count_label.setText("Word count: 0")
     
     def log_text_activity(self):
         """Log text activity in descriptive task."""
         try:
-            text_content = self.response_text.toPlainText()
-            word_count = len([word for word in text_content.strip().split() if word.strip()])
+            document = self.response_text.document()
+            word_count = self._word_count  # Updated by update_word_count just before
             
-            # Log periodically based on word count milestones
-            if word_count > 0 and word_count % 10 == 0:
+            # Log progress by growth since the last entry, so a pause at a round
+            # count doesn't log again and fast typing can't jump past a milestone
+            if word_count - self._last_progress_words >= PROGRESS_LOG_WORDS:
+                self._last_progress_words = word_count
                 self.log_action("DESCRIPTIVE_TEXT_PROGRESS", f"Word count reached: {word_count}")
             
-            # Log when sentences are completed (rough detection)
-            if text_content.endswith('.') or text_content.endswith('!') or text_content.endswith('?'):
+            # Log when a sentence terminator was typed since the last pause
+            sentence_end = self._sentence_end
+            if sentence_end is not None:
+                self._sentence_end = None
                 self.log_action("DESCRIPTIVE_SENTENCE_COMPLETED", f"Sentence completed, total words: {word_count}")
+                if self.line_logging and self.logging_manager:
+                    # Only the paragraph text up to the terminator is scanned
+                    block = document.findBlock(sentence_end - 1)
+                    sentence = _last_sentence(block.text()[:sentence_end - block.position()])
+                    if sentence:
+                        self.logging_manager.log_sentence_completion(sentence)
         except:
             pass  # Don't let logging errors interrupt text input
     
+    def log_partial_text(self):
+        """Hand the current text to the logging manager for crash recovery.
+        
+        The logging manager keeps only the latest snapshot and writes it on a
+        timer, so a burst of typing produces a single PARTIAL_TEXT_UPDATE entry.
+        The snapshot is capped at max_response_chars; the full response is
+        still saved by save_current_response.
+        """
+        if not self.logging_manager:
+            return
+        try:
+            countdown_manager = self.app.countdown_manager
+            countdown_remaining = countdown_manager.get_remaining_time() if countdown_manager.countdown_running else None
+            text = self.response_text.toPlainText()
+            if len(text) > self.max_response_chars:
+                text = text[:self.max_response_chars]
+            self.logging_manager.log_partial_text(text, countdown_remaining, self.current_prompt_index)
+        except Exception as e:
+            print(f"⚠️ Error logging partial text: {e}")
+    
     def enable_navigation(self):
         """Enable navigation when countdown finishes (production mode)."""
         if not self.developer_mode and self.app.current_screen == self.screen_name:
@@ -668,12 +816,19 @@ class DescriptiveTaskScreen(BaseScreen):
     
     def save_current_response(self):
         """Save the current response before leaving the screen."""
-        if hasattr(self, 'response_text') and self.response_text:
+        # Write the last partial snapshot now, before the screen transition entry
+        if self._text_settle_timer:
+            self._text_settle_timer.stop()
+        if self.logging_manager:
+            self.logging_manager.flush_partial_text()
+        # Nothing typed since the last save: skip copying the text out of the widget
+        if self._response_dirty and self.response_text:
             try:
                 current_response = self.response_text.toPlainText().strip()
                 if current_response:
-                    current_prompt = self.prompts[self.current_prompt_index] if self.current_prompt_index < len(self.prompts) else "Unknown prompt"
+                    current_prompt = self.current_prompt_text()
                     self.app.logging_manager.log_descriptive_response(self.current_prompt_index, current_prompt, current_response)
+                self._response_dirty = False
             except Exception as e:
                 print(f"Error saving response: {e}")
     
@@ -767,7 +922,7 @@ class StroopScreen(BaseScreen):
             self.corner_countdown_label = self.countdown_widget.corner_countdown_label
         
         # Video display area - responsive sizing and emphasized
-        self.video_widget = QLabel()
+        self.video_widget = VideoFrameLabel()
         self.video_widget.setStyleSheet(f"background-color: black; border: 3px solid #444444; border-radius: 8px;")
         self.video_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.video_widget.setMinimumSize(video_min_width, video_min_height)
@@ -868,9 +1023,7 @@ class StroopScreen(BaseScreen):
             self.app.video_manager.set_video_end_callback(lambda: self.on_video_end())
             
             # Start video playback from 3-minute mark (180 seconds)
-            fps = self.app.video_manager.cap.get(cv2.CAP_PROP_FPS)
-            frame_number = int(180 * fps)  # 180 seconds * fps
-            self.app.video_manager.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            self.app.video_manager.seek_seconds(180)
             self.app.video_manager.start_pyqt_video_loop(self.video_widget, lambda: self.app.current_screen, "stroop")
             print("🎬 Stroop video started from 3-minute mark")
             self.log_action("STROOP_VIDEO_STARTED_3_MIN", "Stroop video started from 3:00 mark")
@@ -958,7 +1111,6 @@ class NativeStroopScreen(BaseScreen):
         self.recent_colors = []
         
         # Seed random number generator
-        import time
         random.seed(int(time.time()))
         
         # Load configuration or use defaults
@@ -1058,13 +1210,11 @@ class NativeStroopScreen(BaseScreen):
             
         except Exception as e:
             print(f"🚨 ERROR in generate_word_batch: {e}")
-            import traceback
             print(f"🚨 Full traceback: {traceback.format_exc()}")
             return []
     
     def reset_randomization_state(self):
         """Reset randomization state for a fresh start."""
-        import time
         random.seed(int(time.time() * 1000000) % 2**32)
         
         self.recent_words = []
@@ -1162,7 +1312,6 @@ class NativeStroopScreen(BaseScreen):
             
         except Exception as e:
             print(f"🚨 ERROR in setup_screen: {e}")
-            import traceback
             print(f"🚨 Full traceback: {traceback.format_exc()}")
             try:
                 self.log_action("NATIVE_STROOP_SETUP_ERROR", f"Error in setup_screen: {e}")
@@ -1213,7 +1362,6 @@ class NativeStroopScreen(BaseScreen):
             """)
             
             # Create container widget for words using QTextEdit for proper scrolling
-            from PyQt6.QtWidgets import QTextEdit
             self.word_container = QTextEdit()
             self.word_container.setReadOnly(True)
             self.word_container.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -1249,14 +1397,11 @@ class NativeStroopScreen(BaseScreen):
             
         except Exception as e:
             print(f"🚨 ERROR in setup_word_area: {e}")
-            import traceback
             print(f"🚨 Full traceback: {traceback.format_exc()}")
     
     def keyPressEvent(self, event):
         """Handle key press events, especially for Enter key in developer mode."""
         try:
-            from PyQt6.QtCore import Qt
-            
             # Handle Enter key in developer mode
             if (event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter) and self.developer_mode:
                 print("🎯 DEBUG: Enter key detected via keyPressEvent")
@@ -1347,7 +1492,6 @@ class NativeStroopScreen(BaseScreen):
             
         except Exception as e:
             print(f"🚨 ERROR in update_word_display: {e}")
-            import traceback
             print(f"🚨 Full traceback: {traceback.format_exc()}")
     
     def position_corner_countdown(self):
@@ -1400,7 +1544,6 @@ class NativeStroopScreen(BaseScreen):
                         print(f"🎨 Native Stroop countdown started")
                         
                         # Position corner countdown with delay
-                        from PyQt6.QtCore import QTimer
                         QTimer.singleShot(100, self.position_corner_countdown)
                 except Exception as e:
                     print(f"⚠️ Error setting up countdown: {e}")
@@ -1415,7 +1558,6 @@ class NativeStroopScreen(BaseScreen):
             
         except Exception as e:
             print(f"🚨 CRITICAL ERROR in start_stroop_task: {e}")
-            import traceback
             print(f"🚨 Full traceback: {traceback.format_exc()}")
             try:
                 self.log_action("NATIVE_STROOP_ERROR", f"Critical error in start_stroop_task: {e}")
@@ -1453,12 +1595,10 @@ class NativeStroopScreen(BaseScreen):
                     print(f"⚠️ Error stopping countdown: {countdown_error}")
                 
                 # Transition with delay
-                from PyQt6.QtCore import QTimer
                 QTimer.singleShot(100, self.safe_transition_to_next_screen)
                 
         except Exception as e:
             print(f"⚠️ Error in Enter key handler: {e}")
-            import traceback
             print(f"⚠️ Full traceback: {traceback.format_exc()}")
     
     def auto_transition_from_stroop(self):
@@ -1502,10 +1642,31 @@ class NativeStroopScreen(BaseScreen):
             
         except Exception as e:
             print(f"⚠️ Error in Native Stroop transition: {e}")
-            import traceback
             print(f"⚠️ Full traceback: {traceback.format_exc()}")
 
 
+def _math_urgency_style(color, background):
+    """Build the math countdown label stylesheet for one urgency tier."""
+    return f"""
+                color: {color}; 
+                background-color: {background}; 
+                padding: 15px; 
+                border-radius: 10px;
+                border: 3px solid {color};
+                font-weight: bold;
+                font-size: 20px;
+            """
+
+
+# Math countdown label styles per urgency tier, built once
+_MATH_URGENCY_STYLES = (
+    _math_urgency_style("#4CAF50", "rgba(0, 100, 0, 100)"),
+    _math_urgency_style("#FFA500", "rgba(255, 165, 0, 150)"),
+    _math_urgency_style("#FF0000", "rgba(255, 0, 0, 150)"),
+    _math_urgency_style("#FF0000", "rgba(255, 0, 0, 200)")
+)
+
+
 class MathTaskScreen(BaseScreen):
     """Screen for Math subtraction task."""
     
@@ -1514,6 +1675,7 @@ class MathTaskScreen(BaseScreen):
         self.task_started = False
         self.corner_countdown_label = None
         self.math_start_button = None
+        self._urgency_tier = None  # Urgency tier whose style the countdown label has
         
         # Load configuration or use defaults
         try:
@@ -1614,7 +1776,6 @@ class MathTaskScreen(BaseScreen):
         )
         
         # Center the button
-        from PyQt6.QtWidgets import QHBoxLayout
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         button_layout.addWidget(self.math_start_button)
@@ -1659,6 +1820,7 @@ class MathTaskScreen(BaseScreen):
                 border: 2px solid #FFA500;
                 font-weight: bold;
             """)
+            self._urgency_tier = None
         
         # Start unified countdown if enabled
         if self.countdown_enabled:
@@ -1688,34 +1850,20 @@ class MathTaskScreen(BaseScreen):
             return
             
         try:
-            # Update styling based on remaining time
+            # Urgency tier based on remaining time
             if remaining_seconds > 60:
-                # Normal state - green
-                color = "#4CAF50"
-                background = "rgba(0, 100, 0, 100)"
+                tier = 0  # Normal state - green
             elif remaining_seconds > 30:
-                # Warning state - orange
-                color = "#FFA500" 
-                background = "rgba(255, 165, 0, 150)"
+                tier = 1  # Warning state - orange
             elif remaining_seconds > 10:
-                # Critical state - red
-                color = "#FF0000"
-                background = "rgba(255, 0, 0, 150)"
+                tier = 2  # Critical state - red
             else:
-                # Emergency state - flashing red
-                color = "#FF0000"
-                background = "rgba(255, 0, 0, 200)"
+                tier = 3  # Emergency state - flashing red
             
-            # Apply updated styling
-            self.countdown_label.setStyleSheet(f"""
-                color: {color}; 
-                background-color: {background}; 
-                padding: 15px; 
-                border-radius: 10px;
-                border: 3px solid {color};
-                font-weight: bold;
-                font-size: 20px;
-            """)
+            # Restyle only when the tier changes; setStyleSheet re-polishes the label
+            if tier != self._urgency_tier:
+                self._urgency_tier = tier
+                self.countdown_label.setStyleSheet(_MATH_URGENCY_STYLES[tier])
         except Exception as e:
             print(f"⚠️ Error updating countdown urgency: {e}")
     
@@ -1755,8 +1903,6 @@ class ContentPerformanceScreen(BaseScreen):
     def setup_screen(self):
         """Setup the content performance task screen."""
         try:
-            from PyQt6.QtWidgets import QLabel, QHBoxLayout, QVBoxLayout, QPushButton
-            from PyQt6.QtGui import QFont
             from config import TASK_SELECTION_MODE
             
             self.set_background_color(self.background_color)
@@ -1817,7 +1963,6 @@ class ContentPerformanceScreen(BaseScreen):
                            
         except Exception as e:
             print(f"⚠️ Error setting up content performance screen: {e}")
-            import traceback
             print(f"⚠️ Full traceback: {traceback.format_exc()}")
             # Fallback to simple screen
             self.setup_fallback_screen()
@@ -1825,8 +1970,6 @@ class ContentPerformanceScreen(BaseScreen):
     def setup_task_selection_buttons(self, task_options):
         """Setup task selection buttons for self-selection mode."""
         try:
-            from PyQt6.QtWidgets import QVBoxLayout, QPushButton
-            
             selection_label = QLabel("Please select your preferred task:")
             selection_label.setFont(QFont('Arial', 20, QFont.Weight.Bold))
             selection_label.setStyleSheet(f"color: {self.colors['title']}; background-color: transparent;")
@@ -1834,27 +1977,18 @@ class ContentPerformanceScreen(BaseScreen):
             self.layout.addWidget(selection_label)
             self.layout.addSpacing(20)
             
+            # The buttons share one container carrying their style sheet and
+            # one font, so the style is parsed once rather than per button
+            buttons_frame = self.add_widget(QFrame())
+            buttons_frame.setStyleSheet(_TASK_BUTTON_STYLE)
+            buttons_layout = QVBoxLayout(buttons_frame)
+            buttons_layout.setContentsMargins(0, 0, 0, 0)
+            button_font = QFont('Arial', 16)
+            
             # Create buttons for each task option
             for task_key, task_info in task_options.items():
                 task_button = QPushButton(f"{task_info['name']}\n{task_info['brief']}")
-                task_button.setFont(QFont('Arial', 16))
-                task_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #4CAF50;
-                        color: white;
-                        border: 2px solid #45a049;
-                        border-radius: 10px;
-                        padding: 15px;
-                        margin: 5px;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background-color: #45a049;
-                    }
-                    QPushButton:pressed {
-                        background-color: #3d8b40;
-                    }
-                """)
+                task_button.setFont(button_font)
                 task_button.setMinimumHeight(80)
                 task_button.clicked.connect(lambda checked, task=task_key: self.on_task_selected(task))
                 
@@ -1863,8 +1997,10 @@ class ContentPerformanceScreen(BaseScreen):
                 button_layout.addStretch()
                 button_layout.addWidget(task_button)
                 button_layout.addStretch()
-                self.layout.addLayout(button_layout)
-                self.layout.addSpacing(10)
+                buttons_layout.addLayout(button_layout)
+                buttons_layout.addSpacing(10)
+            
+            self.layout.addWidget(buttons_frame)
                 
         except Exception as e:
             print(f"⚠️ Error setting up task selection buttons: {e}")
@@ -1873,8 +2009,6 @@ class ContentPerformanceScreen(BaseScreen):
     def setup_continue_button(self):
         """Setup continue button for assigned tasks."""
         try:
-            from PyQt6.QtWidgets import QHBoxLayout
-            
             continue_button = self.create_button(
                 "CONTINUE TO TASK",
                 command=self.transition_to_post_study_rest,
@@ -1898,8 +2032,6 @@ class ContentPerformanceScreen(BaseScreen):
     def setup_fallback_screen(self):
         """Setup a simple fallback screen if there are errors."""
         try:
-            from PyQt6.QtWidgets import QLabel, QHBoxLayout
-            
             fallback_label = QLabel("Please complete your assigned task on the Samsung phone.")
             fallback_label.setFont(QFont('Arial', 20))
             fallback_label.setStyleSheet(f"color: {self.colors['text_primary']}; background-color: transparent;")
@@ -1970,10 +2102,6 @@ class PostStudyRestScreen(BaseScreen):
     def setup_screen(self):
         """Setup the post-study relaxation screen with video background and responsive layout."""
         try:
-            from PyQt6.QtWidgets import QLabel
-            from PyQt6.QtGui import QFont
-            from PyQt6.QtCore import QTimer
-            
             self.set_background_color(self.background_color)
             
             # Get screen dimensions for responsive scaling
@@ -1986,7 +2114,7 @@ class PostStudyRestScreen(BaseScreen):
             text_font_size = max(32, min(96, int(screen_width * 0.05)))
             
             # Setup video display area - responsive sizing
-            self.video_widget = QLabel()
+            self.video_widget = VideoFrameLabel()
             self.video_widget.setStyleSheet(f"background-color: {self.background_color}; border: 2px solid #444444; border-radius: 8px;")
             self.video_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.video_widget.setMinimumSize(video_min_width, video_min_height)
@@ -2097,13 +2225,9 @@ class PostStudyRestScreen(BaseScreen):
             self.log_action("POST_STUDY_REST_SCREEN_DISPLAYED", "Post-study relaxation screen displayed with video/placeholder")
         except Exception as e:
             print(f"⚠️ Error setting up post-study rest screen: {e}")
-            import traceback
             print(f"⚠️ Full traceback: {traceback.format_exc()}")
             # Create a minimal fallback screen
             try:
-                from PyQt6.QtWidgets import QLabel
-                from PyQt6.QtGui import QFont
-                
                 fallback_label = QLabel("Study Complete - Thank You!")
                 fallback_label.setFont(QFont('Arial', 32, QFont.Weight.Bold))
                 fallback_label.setStyleSheet("""
@@ -2144,7 +2268,6 @@ class PostStudyRestScreen(BaseScreen):
     
     def start_post_study_countdown(self, minutes):
         """Start hidden countdown for post-study relaxation screen auto-transition."""
-        from PyQt6.QtCore import QTimer
         total_time = minutes * 60 * 1000
         
         def auto_transition():
@@ -2174,7 +2297,6 @@ class PostStudyRestScreen(BaseScreen):
                 print("⚠️ No during-study survey 2 method available")
         except Exception as e:
             print(f"⚠️ Error in post-study rest transition: {e}")
-            import traceback
             print(f"⚠️ Full traceback: {traceback.format_exc()}")
     
     def on_enter_pressed(self):
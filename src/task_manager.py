@@ -2,7 +2,35 @@
 
 import json
 import os
+import queue
+import threading
+from collections import Counter
 from config import TASK_ASSIGNMENTS_FILE, TASK_SELECTION_MODE
+from logging_manager import dprint
+
+# orjson is optional; both paths read and write the assignments file as bytes
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_pretty(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Assignments file resolved once against the project root (the parent of src/),
+# so it is found the same way whatever directory the app is launched from
+ASSIGNMENTS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), TASK_ASSIGNMENTS_FILE)
+
+# Short task descriptions used in the task logs and session info
+TASK_DESCRIPTIONS = {
+    "mandala": "drawing your figure",
+    "diary": "journal down your mind",
+    "mindfulness": "watch a fun video"
+}
 
 
 class TaskManager:
@@ -11,17 +39,88 @@ class TaskManager:
     def __init__(self, logging_manager):
         self.logging_manager = logging_manager
         self.selected_task = None
+        
+        # Parsed task_assignments.json, reused while the file's mtime is unchanged
+        self._assignments_cache = None
+        self._assignments_mtime = None
+        
+        # Per-task assignment counts, rebuilt on load and updated on each write
+        self._task_counts = Counter()
+        self._total = 0
+        
+        # Assignment file writes, done by a background thread so clicks don't wait on disk
+        self._write_q = queue.Queue()
+        self._write_gen = 0
+        self._writer = None
+    
+    def _load_assignments(self):
+        """Return the parsed assignments file, re-reading it only when it changed on disk."""
+        # While writes are queued the cache is newer than the file
+        if self._write_q.unfinished_tasks:
+            return self._assignments_cache
+        
+        st = os.stat(ASSIGNMENTS_FILE)
+        if st.st_mtime_ns == self._assignments_mtime:
+            return self._assignments_cache
+        
+        with open(ASSIGNMENTS_FILE, 'rb') as f:
+            data = _loads(f.read())
+        
+        self._assignments_cache = data
+        self._assignments_mtime = st.st_mtime_ns
+        
+        assignments = data.get("assignments", {})
+        self._task_counts = Counter(assignments.values())
+        self._total = len(assignments)
+        return data
+    
+    def _assign(self, data, participant_id, task_name):
+        """Record a participant's task in data and update the running counts."""
+        assignments = data["assignments"]
+        previous_task = assignments.get(participant_id)
+        if previous_task is None:
+            self._total += 1
+        else:
+            self._task_counts[previous_task] -= 1
+        assignments[participant_id] = task_name
+        self._task_counts[task_name] += 1
+    
+    def _save_assignments(self, data):
+        """Update the cache and queue the assignments file write for the writer thread."""
+        self._assignments_cache = data
+        self._write_gen += 1
+        # Serialize now so later changes to data can't race with the write
+        self._write_q.put((self._write_gen, ASSIGNMENTS_FILE, _dumps_pretty(data)))
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="assignments-writer", daemon=True)
+            self._writer.start()
+    
+    def _writer_loop(self):
+        """Background writer: replace the assignments file atomically for each queued write."""
+        while True:
+            gen, path, payload = self._write_q.get()
+            try:
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+                # Only the latest write matches the cache; older ones leave the mtime stale
+                if gen == self._write_gen:
+                    self._assignments_mtime = os.stat(path).st_mtime_ns
+            except Exception as e:
+                print(f"⚠️ Error writing task assignments: {e}")
+            finally:
+                self._write_q.task_done()
+    
+    def flush_assignments(self):
+        """Block until all queued assignment writes are on disk."""
+        self._write_q.join()
     
     def get_task_distribution_stats(self):
         """Get current task distribution statistics."""
-        assignments_file = TASK_ASSIGNMENTS_FILE
-        
         try:
-            with open(assignments_file, 'r') as f:
-                data = json.load(f)
-            
-            assignments = data.get("assignments", {})
-            total_assignments = len(assignments)
+            self._load_assignments()
+            total_assignments = self._total
             
             if total_assignments == 0:
                 return {
@@ -34,11 +133,7 @@ class TaskManager:
                     "mindfulness_percent": 0
                 }
             
-            # Count each task type
-            task_counts = {"mandala": 0, "diary": 0, "mindfulness": 0}
-            for task in assignments.values():
-                if task in task_counts:
-                    task_counts[task] += 1
+            task_counts = self._task_counts
             
             # Calculate percentages
             stats = {
@@ -67,12 +162,9 @@ class TaskManager:
     
     def get_random_assigned_task(self, participant_id):
         """Get the next task in rotation for random assignment mode."""
-        assignments_file = TASK_ASSIGNMENTS_FILE
-        
         try:
             # Load current assignments
-            with open(assignments_file, 'r') as f:
-                data = json.load(f)
+            data = self._load_assignments()
             
             # Get next task in rotation
             task_rotation = data["task_rotation"]
@@ -82,13 +174,12 @@ class TaskManager:
             
             # Update assignments
             data["last_assigned_index"] = next_index
-            data["assignments"][participant_id] = assigned_task
+            self._assign(data, participant_id, assigned_task)
             
             # Save updated assignments
-            with open(assignments_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._save_assignments(data)
             
-            print(f"🎯 System assigned task: {assigned_task} (rotation index: {next_index})")
+            dprint(f"🎯 System assigned task: {assigned_task} (rotation index: {next_index})")
             return assigned_task
             
         except Exception as e:
@@ -98,17 +189,13 @@ class TaskManager:
     
     def save_user_task_selection(self, participant_id, task_name):
         """Save user's task selection to file."""
-        assignments_file = TASK_ASSIGNMENTS_FILE
-        
         try:
             # Load and update assignments file
-            with open(assignments_file, 'r') as f:
-                data = json.load(f)
+            data = self._load_assignments()
             
-            data["assignments"][participant_id] = task_name
+            self._assign(data, participant_id, task_name)
             
-            with open(assignments_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._save_assignments(data)
                 
         except Exception as e:
             print(f"⚠️ Error saving task selection: {e}")
@@ -118,18 +205,14 @@ class TaskManager:
         # Get updated stats
         updated_stats = self.get_task_distribution_stats()
         
-        # Log detailed selection information
-        self.logging_manager.log_action(
-            "TASK_SELECTED", 
-            f"User selected task: {task_name} | Participant: {participant_id} | Selection mode: {selection_mode}"
-        )
-        self.logging_manager.log_action(
-            "TASK_DISTRIBUTION_AFTER_SELECTION", 
-            f"After selection - Total: {updated_stats['total_assignments']}, "
-            f"Mandala: {updated_stats['mandala_count']} ({updated_stats['mandala_percent']}%), "
-            f"Diary: {updated_stats['diary_count']} ({updated_stats['diary_percent']}%), "
-            f"Mindfulness: {updated_stats['mindfulness_count']} ({updated_stats['mindfulness_percent']}%)"
-        )
+        # Log detailed selection information; the distribution is logged as
+        # the stats dict itself rather than formatted into a string
+        self.logging_manager.log_actions_batch([
+            ("TASK_SELECTED",
+             f"User selected task: {task_name} | Participant: {participant_id} | Selection mode: {selection_mode}"),
+            ("TASK_DISTRIBUTION_AFTER_SELECTION",
+             {"mode": selection_mode, "task": task_name, "after": updated_stats}),
+        ])
     
     def log_task_assignment(self, task_name, participant_id, selection_mode):
         """Log task assignment for random assignment mode."""
@@ -138,24 +221,14 @@ class TaskManager:
         self.logging_manager.add_task_selection_to_session_info(task_name, selection_mode, distribution_stats)
         
         # Log the assignment
-        self.logging_manager.log_action(
-            "TASK_SELECTION_MODE", 
-            f"Mode: {selection_mode} | Assigned task: {task_name}"
-        )
-        self.logging_manager.log_action(
-            "TASK_ASSIGNED", 
-            f"System assigned task: {task_name} | Participant: {participant_id}"
-        )
+        self.logging_manager.log_actions_batch([
+            ("TASK_SELECTION_MODE", f"Mode: {selection_mode} | Assigned task: {task_name}"),
+            ("TASK_ASSIGNED", f"System assigned task: {task_name} | Participant: {participant_id}"),
+        ])
     
     def log_task_to_perform(self, task_name, selection_mode):
         """Log the final task that will be performed."""
-        task_descriptions = {
-            "mandala": "drawing your figure",
-            "diary": "journal down your mind", 
-            "mindfulness": "watch a fun video"
-        }
-        
-        description = task_descriptions.get(task_name, "unknown task")
+        description = TASK_DESCRIPTIONS.get(task_name, "unknown task")
         self.logging_manager.log_action(
             "TASK_TO_PERFORM", 
             f"Participant will perform: {task_name} ({description}) | Selection mode: {selection_mode}"
@@ -249,18 +322,17 @@ class TaskManager:
     def get_assigned_task_for_participant(self, participant_id):
         """Get the assigned task for a specific participant from the assignments file."""
         try:
-            with open(TASK_ASSIGNMENTS_FILE, 'r') as f:
-                data = json.load(f)
+            data = self._load_assignments()
             
             assignments = data.get("assignments", {})
             assigned_task = assignments.get(participant_id)
             
             if assigned_task:
-                print(f"🎯 Found existing assignment for {participant_id}: {assigned_task}")
+                dprint(f"🎯 Found existing assignment for {participant_id}: {assigned_task}")
                 return assigned_task
             else:
                 # If no assignment exists, create one using rotation
-                print(f"🎯 No existing assignment for {participant_id}, creating new assignment")
+                dprint(f"🎯 No existing assignment for {participant_id}, creating new assignment")
                 return self.get_random_assigned_task(participant_id)
                 
         except Exception as e:
@@ -279,7 +351,7 @@ class TaskManager:
             # Log the selection
             self.log_task_selection(selected_task, participant_id, "self_selection")
             
-            print(f"🎯 User self-selected task: {selected_task}")
+            dprint(f"🎯 User self-selected task: {selected_task}")
             return True
             
         except Exception as e:
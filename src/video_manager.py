@@ -1,12 +1,92 @@
 #!/usr/bin/env python3
 
-import cv2
 import os
-import time
+import queue
 import threading
-from PIL import Image
-from PyQt6.QtGui import QPixmap
+import time
+from PyQt6.QtGui import QImage, QPixmap, QPainter
 from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QLabel
+from logging_manager import dprint
+
+# Video settings added after the first deployments; an older, hand-edited
+# config.py may not define them yet
+try:
+    from config import VIDEO_MAX_DISPLAY_FPS
+except ImportError:
+    VIDEO_MAX_DISPLAY_FPS = 30
+
+try:
+    from config import VIDEO_HW_DECODE
+except ImportError:
+    VIDEO_HW_DECODE = True
+
+# cv2 is a heavy C-extension import only needed once a video screen is
+# shown, so it is loaded on first use instead of at app startup.
+_cv2_mod = None
+
+
+def _cv2():
+    """Return the cv2 module, importing it on first use."""
+    global _cv2_mod
+    if _cv2_mod is None:
+        import cv2
+        _cv2_mod = cv2
+    return _cv2_mod
+
+
+# Resized frames the decoder thread may hold ready ahead of the display
+VIDEO_DECODE_QUEUE_SIZE = 2
+
+# Screens the video loop plays on when no expected screen is given
+_VIDEO_SCREENS = ("relaxation", "stroop", "post_study_rest", "poststudyrest")
+
+# Queued by the decoder thread when the clip ends, before it loops to the start
+_END_OF_PASS = object()
+
+
+class VideoFrameLabel(QLabel):
+    """QLabel that shows video frames by repainting a single frame slot.
+    
+    QLabel.setPixmap re-runs the label's geometry update and so the parent
+    layout on every call; set_frame only swaps the frame and schedules a
+    repaint of the label. Frames may be QPixmaps or QImages (drawn straight
+    from the decoder's buffer, with no pixmap copy). They are drawn centered
+    and clipped, as QLabel draws an oversized pixmap with AlignCenter. Text
+    (placeholders) still works through setText until the first frame arrives.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._frame = None
+    
+    def set_frame(self, pixmap):
+        """Show pixmap as the current frame."""
+        if self._frame is None and self.text():
+            self.clear()
+        self._frame = pixmap
+        self.update()
+    
+    def setText(self, text):
+        self._frame = None
+        super().setText(text)
+    
+    def paintEvent(self, event):
+        if self._frame is None:
+            super().paintEvent(event)
+            return
+        # Draw the styled frame/background, then the video frame on top
+        painter = QPainter(self)
+        self.drawFrame(painter)
+        rect = self.contentsRect()
+        painter.setClipRect(rect)
+        x = rect.x() + (rect.width() - self._frame.width()) // 2
+        y = rect.y() + (rect.height() - self._frame.height()) // 2
+        if isinstance(self._frame, QImage):
+            painter.drawImage(x, y, self._frame)
+        else:
+            painter.drawPixmap(x, y, self._frame)
+        painter.end()
 
 
 class VideoManager:
@@ -14,6 +94,22 @@ class VideoManager:
     
     def __init__(self):
         self.cap = None
+        self._video_path = None  # File the open capture reads; kept open across screens
+        self._cv2 = None  # cv2 module, bound by init_video for the per-frame paths
+        
+        # Decode and resize destinations reused across frames (OpenCV writes into
+        # them in place when the shape matches, so no per-frame allocation)
+        self._raw_frame = None
+        self._scaled_frame = None
+        
+        # Decoder thread: reads and resizes frames into _frame_q ahead of the
+        # display timer, which only converts them to pixmaps on the GUI thread
+        self._decoder = None
+        self._decoder_stop = None
+        self._frame_q = None
+        # Buffer behind the QImage currently shown; kept so the widget can
+        # still paint it after the decoder and its buffers are gone
+        self._shown_buffer = None
         self.video_frame = None
         self.running = True
         
@@ -28,9 +124,41 @@ class VideoManager:
         # Video timing properties
         self.video_fps = 30  # Default FPS
         self.frame_interval_ms = 33  # Default ~30 FPS interval
+        self._frame_period = 1 / 30  # Exact seconds per displayed frame (frame_interval_ms is rounded)
+        self.frames_per_tick = 1  # Source frames consumed per displayed frame
+        self._video_target_size = None  # (width, height) frames are resized to, set on the first frame
         
         # Video completion callbacks
         self.video_end_callback = None
+        
+        # Playback clock: frames are due every _frame_period from _playback_t0.
+        # Only the thread reading frames (the decoder, or the GUI thread for the
+        # stroop loop) touches it; other code asks for a restart via _restart_clock.
+        self._playback_t0 = None  # time.monotonic() of the first tick; None restarts the clock
+        self._ticks_played = 0
+        self._clock_reset = threading.Event()
+        
+        # Frame timer of start_pyqt_video_loop, and the screen the loop last paused for
+        self.video_timer = None
+        self._last_pause_log = None
+        
+        # Stroop loop timer (runs on the GUI thread) and its frame consumer
+        self.stroop_timer = None
+        self._stroop_screen_callback = None
+        self._stroop_update_callback = None
+    
+    def preload(self):
+        """Import cv2 on a background thread so the first video screen doesn't wait on it."""
+        if _cv2_mod is not None:
+            return
+        
+        def load():
+            try:
+                _cv2()
+            except ImportError as e:
+                print(f"⚠️ Could not preload OpenCV: {e}")
+        
+        threading.Thread(target=load, name="cv2-preload", daemon=True).start()
     
     def set_screen_dimensions(self, width, height):
         """Set screen dimensions for video scaling."""
@@ -42,18 +170,35 @@ class VideoManager:
         self.video_end_callback = callback
     
     def init_video(self, video_path):
-        """Initialize video capture."""
+        """Initialize video capture.
+        
+        Re-initializing the clip that is already open (e.g. the relaxation video
+        for post-study rest) rewinds it instead of reopening the file.
+        """
         print(f"🎬 Initializing video: {video_path}")
         
         # Reset running flag when initializing new video
         self.running = True
+        self._stop_decoder()
+        
+        if self.cap is not None and video_path == self._video_path:
+            print(f"✅ Video reused: {os.path.basename(video_path)}")
+            self.seek_seconds(0)
+            return
+        
+        self._release_capture()
+        self._video_target_size = None
         
         if os.path.exists(video_path):
-            self.cap = cv2.VideoCapture(video_path)
+            cv2 = self._cv2 = _cv2()
+            self.cap = self._open_capture(video_path)
+            # Keep only the newest decoded frame instead of OpenCV's default queue
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             if not self.cap.isOpened():
                 print(f"❌ Warning: Could not open video file {video_path}")
                 self.cap = None
             else:
+                self._video_path = video_path
                 # Get video properties for proper playback timing
                 fps = self.cap.get(cv2.CAP_PROP_FPS)
                 frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
@@ -61,90 +206,255 @@ class VideoManager:
                 
                 # Store FPS for proper timing
                 self.video_fps = fps if fps > 0 else 30  # Fallback to 30 FPS
-                self.frame_interval_ms = int(1000 / self.video_fps)  # Convert to milliseconds
+                # Sources faster than the display rate skip (grab without decode) the
+                # frames in between instead of decoding every one
+                self.frames_per_tick = max(1, round(self.video_fps / VIDEO_MAX_DISPLAY_FPS))
+                self._frame_period = self.frames_per_tick / self.video_fps
+                self.frame_interval_ms = int(1000 * self._frame_period)  # Convert to milliseconds
                 
                 print(f"✅ Video initialized: {os.path.basename(video_path)}")
                 print(f"🎬 Video properties: {fps:.1f} FPS, {frame_count} frames, {duration:.1f}s duration")
-                print(f"🎬 Frame interval: {self.frame_interval_ms}ms")
+                print(f"🎬 Frame interval: {self.frame_interval_ms}ms ({self.frames_per_tick} source frame(s) per tick)")
         else:
             print(f"❌ Warning: Video file not found at {video_path}")
-            self.cap = None
+    
+    def _open_capture(self, video_path):
+        """Open video_path, with hardware decoding when enabled and supported.
+        
+        Acceleration can only be requested when the capture is opened (OpenCV
+        4.5.2+); builds or files it doesn't work for fall back to software
+        decoding. Frames come back as BGR arrays either way.
+        """
+        cv2 = self._cv2
+        if VIDEO_HW_DECODE and hasattr(cv2, 'VIDEO_ACCELERATION_ANY'):
+            try:
+                cap = cv2.VideoCapture(video_path, cv2.CAP_ANY,
+                                       [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+                if cap.isOpened():
+                    acceleration = int(cap.get(cv2.CAP_PROP_HW_ACCELERATION))
+                    print(f"🎬 Hardware decoding: {'on' if acceleration != cv2.VIDEO_ACCELERATION_NONE else 'unavailable'}")
+                    return cap
+                cap.release()
+            except Exception as e:
+                print(f"🎬 Hardware decoding unavailable: {e}")
+        return cv2.VideoCapture(video_path)
+    
+    def _read_frame(self):
+        """Read the next frame to display, skipping decode of frames that are not shown.
+        
+        When a tick runs more than one frame interval late (e.g. the GUI thread
+        was busy), the overdue frames are grabbed without decoding so playback
+        catches up instead of drifting behind real time.
+        """
+        skip = self.frames_per_tick - 1
+        now = time.monotonic()
+        if self._clock_reset.is_set():
+            self._clock_reset.clear()
+            self._playback_t0 = None
+        if self._playback_t0 is None:
+            self._playback_t0 = now
+            self._ticks_played = 0
+        else:
+            behind = int((now - self._playback_t0) / self._frame_period) - self._ticks_played
+            if behind > 1:
+                skip += (behind - 1) * self.frames_per_tick
+                self._ticks_played += behind - 1
+        self._ticks_played += 1
+        
+        for _ in range(skip):
+            if not self.cap.grab():
+                break
+        ret, frame = self.cap.read(self._raw_frame)
+        if ret:
+            self._raw_frame = frame
+        return ret, frame
+    
+    def _fit_size(self, frame):
+        """Return the (width, height) that covers the screen at the frame's aspect ratio."""
+        # Get original video dimensions
+        video_height, video_width = frame.shape[:2]
+        
+        # Calculate aspect ratios
+        video_aspect = video_width / video_height
+        screen_aspect = self.screen_width / self.screen_height
+        
+        # Scale to fit screen while maintaining aspect ratio
+        if video_aspect > screen_aspect:
+            # Video is wider - scale by height
+            return int(self.screen_height * video_aspect), self.screen_height
+        # Video is taller - scale by width
+        return self.screen_width, int(self.screen_width / video_aspect)
+    
+    def _restart_clock(self):
+        """Restart the playback clock at the next frame read, e.g. after a pause."""
+        self._clock_reset.set()
+    
+    def _start_decoder(self):
+        """Start the decoder thread for the current capture."""
+        self._playback_t0 = None  # No decoder is running yet, so the clock is free to reset
+        self._frame_q = queue.Queue(maxsize=VIDEO_DECODE_QUEUE_SIZE)
+        self._decoder_stop = threading.Event()
+        self._decoder = threading.Thread(
+            target=self._decode_loop, args=(self._frame_q, self._decoder_stop),
+            name="video-decoder", daemon=True
+        )
+        self._decoder.start()
+    
+    def _stop_decoder(self):
+        """Stop the decoder thread; the capture is safe to seek or release afterwards.
+        
+        Joins without a timeout: OpenCV captures aren't thread-safe, so the
+        capture must not be touched while the thread may still be in read().
+        The loop checks the stop flag at least every 0.1s and after each frame.
+        """
+        if self._decoder is None:
+            return
+        self._decoder_stop.set()
+        self._decoder.join()
+        self._decoder = None
+        self._decoder_stop = None
+        self._frame_q = None
+    
+    def _put_decoded(self, frame_q, stop, item):
+        """Queue an item for the display, waiting while the queue is full; False once stopped."""
+        while not stop.is_set():
+            try:
+                frame_q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def _decode_loop(self, frame_q, stop):
+        """Decoder thread: read, skip and resize frames, looping at the end of the clip.
+        
+        A blocking put paces decoding to the display. Frames are expanded to
+        32-bit BGRA here, the byte layout of QImage.Format_RGB32, so the GUI
+        thread's QPixmap.fromImage is a plain copy with no pixel conversion.
+        The BGRA frames rotate through a small ring of buffers, one more than
+        can be queued or shown at once, so a queued or displayed frame is
+        never overwritten. A frame identical to the previous one, compared
+        pixel for pixel (static footage), is queued as None, so it is neither
+        converted nor repainted.
+        """
+        cv2 = self._cv2
+        cap = self.cap
+        # Two resize buffers: the newest frame and the last one that was queued
+        resized = [None, None]
+        current = 0
+        last_shown = None
+        buffers = [None] * (VIDEO_DECODE_QUEUE_SIZE + 2)
+        slot = 0
+        read_since_loop = False
+        try:
+            while not stop.is_set():
+                # Pace decoding on the playback clock, one frame ahead of when
+                # each frame is due, so the display timer's rounded interval
+                # can't play the clip faster than its source rate
+                if self._playback_t0 is not None:
+                    due = self._playback_t0 + (self._ticks_played - 1) * self._frame_period
+                    wait = due - time.monotonic()
+                    if wait > 0 and stop.wait(wait):
+                        return
+                
+                ret, frame = self._read_frame()
+                if not ret:
+                    if not read_since_loop:
+                        print("🎬 ERROR: Could not read frame even after restart")
+                        return
+                    if not self._put_decoded(frame_q, stop, _END_OF_PASS):
+                        return
+                    # Loop video - restart from beginning
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    read_since_loop = False
+                    last_shown = None
+                    continue
+                read_since_loop = True
+                
+                # Video and screen sizes are fixed, so the target size is worked out once
+                target_size = self._video_target_size
+                if target_size is None:
+                    target_size = self._video_target_size = self._fit_size(frame)
+                
+                # Resize frame using faster interpolation
+                scaled = resized[current] = cv2.resize(frame, target_size, dst=resized[current],
+                                                       interpolation=cv2.INTER_LINEAR)
+                if last_shown is not None and cv2.norm(scaled, last_shown, cv2.NORM_INF) == 0:
+                    frame = None  # Same picture as the previous frame
+                else:
+                    last_shown = scaled
+                    current ^= 1
+                    frame = buffers[slot] = cv2.cvtColor(scaled, cv2.COLOR_BGR2BGRA, dst=buffers[slot])
+                    slot = (slot + 1) % len(buffers)
+                if not self._put_decoded(frame_q, stop, frame):
+                    return
+        except Exception as e:
+            print(f"Warning: Error in video decoder: {e}")
+    
+    def _frame_to_image(self, frame):
+        """Wrap a resized BGR or BGRA frame in a QImage without copying it."""
+        height, width, channels = frame.shape
+        image_format = QImage.Format.Format_RGB32 if channels == 4 else QImage.Format.Format_BGR888
+        return QImage(frame.data, width, height, frame.strides[0], image_format)
+    
+    def _frame_to_pixmap(self, frame, context=""):
+        """Convert a resized BGR or BGRA frame to a QPixmap."""
+        try:
+            # Wrap the numpy buffer directly - no intermediate copy;
+            # QPixmap.fromImage makes the only copy
+            return QPixmap.fromImage(self._frame_to_image(frame))
+        except Exception as photo_error:
+            print(f"🎬 ERROR creating {context}QPixmap: {photo_error}")
+            # Fallback: uncompressed PPM encode, far cheaper than a PIL PNG round-trip
+            try:
+                ok, buffer = self._cv2.imencode('.ppm', frame)
+                pixmap = QPixmap()
+                if ok and pixmap.loadFromData(buffer.tobytes(), 'PPM'):
+                    return pixmap
+                print(f"🎬 ERROR: Failed to load {context}pixmap from buffer")
+                return None
+            except Exception as fallback_error:
+                print(f"🎬 ERROR in {context}fallback QPixmap creation: {fallback_error}")
+                return None
     
     def get_video_frame(self):
-        """Get current video frame for relaxation screen."""
+        """Get current video frame for relaxation screen.
+        
+        Frames are decoded and resized by the decoder thread; this only wraps
+        the next ready frame in a QImage, and returns None if none is ready.
+        """
         try:
             if self.cap is None:
                 print("🎬 ERROR: Video capture is None")
                 return None
-                
-            ret, frame = self.cap.read()
-            if not ret:
+            if self._decoder is None:
+                self._start_decoder()
+            
+            try:
+                item = self._frame_q.get_nowait()
+            except queue.Empty:
+                return None
+            
+            if item is _END_OF_PASS:
                 # Video has ended - check if we should call the end callback
-                print("🎬 End of video reached")
+                dprint("🎬 End of video reached")
                 if self.video_end_callback:
-                    print("🎬 Calling video end callback")
+                    dprint("🎬 Calling video end callback")
                     self.video_end_callback()
                     # Only call the callback once
                     self.video_end_callback = None
                 
-                # Loop video - restart from beginning
-                print("🎬 Looping back to start")
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                ret, frame = self.cap.read()
-                if not ret:
-                    print("🎬 ERROR: Could not read frame even after restart")
-                    return None
-            
-            # Get original video dimensions
-            video_height, video_width = frame.shape[:2]
-            
-            # Calculate aspect ratios
-            video_aspect = video_width / video_height
-            screen_aspect = self.screen_width / self.screen_height
-            
-            # Scale to fit screen while maintaining aspect ratio
-            if video_aspect > screen_aspect:
-                # Video is wider - scale by height
-                new_height = self.screen_height
-                new_width = int(self.screen_height * video_aspect)
-            else:
-                # Video is taller - scale by width
-                new_width = self.screen_width
-                new_height = int(self.screen_width / video_aspect)
-            
-            # Resize frame using faster interpolation
-            frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+                # The decoder loops back to the start by itself
+                dprint("🎬 Looping back to start")
+                return None
             
-            # Convert BGR to RGB
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if item is None:
+                # Unchanged picture: keep showing the current frame without a repaint
+                return None
             
-            # Convert directly to QPixmap using a more efficient method
-            try:
-                # Create QPixmap directly from numpy array - more efficient than PIL conversion
-                from PyQt6.QtGui import QImage
-                height, width, channel = frame.shape
-                bytes_per_line = 3 * width
-                q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-                pixmap = QPixmap.fromImage(q_image)
-                return pixmap
-            except Exception as photo_error:
-                print(f"🎬 ERROR creating QPixmap: {photo_error}")
-                # Fallback to original method if direct conversion fails
-                try:
-                    pil_image = Image.fromarray(frame)
-                    import io
-                    buffer = io.BytesIO()
-                    pil_image.save(buffer, format='PNG')
-                    buffer.seek(0)
-                    pixmap = QPixmap()
-                    if pixmap.loadFromData(buffer.getvalue()):
-                        return pixmap
-                    else:
-                        print("🎬 ERROR: Failed to load pixmap from buffer")
-                        return None
-                except Exception as fallback_error:
-                    print(f"🎬 ERROR in fallback QPixmap creation: {fallback_error}")
-                    return None
+            # Show the decoder's buffer as is; it is not reused while displayed
+            self._shown_buffer = item
+            return self._frame_to_image(item)
         except Exception as e:
             print(f"Warning: Error reading video frame: {e}")
             return None
@@ -154,78 +464,52 @@ class VideoManager:
         try:
             if self.cap is None:
                 return None
+            cv2 = self._cv2
                 
-            ret, frame = self.cap.read()
+            ret, frame = self._read_frame()
             if not ret:
                 # Video has ended - check if we should call the end callback
-                print("🎬 Stroop video ended")
+                dprint("🎬 Stroop video ended")
                 if self.video_end_callback:
-                    print("🎬 Calling stroop video end callback")
+                    dprint("🎬 Calling stroop video end callback")
                     self.video_end_callback()
                     # Only call the callback once
                     self.video_end_callback = None
                 
                 # Loop video - restart from beginning
                 self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                ret, frame = self.cap.read()
+                ret, frame = self.cap.read(self._raw_frame)
                 if not ret:
                     return None
             
             # Resize frame to fit canvas (800x450) using faster interpolation
-            frame = cv2.resize(frame, (800, 450), interpolation=cv2.INTER_LINEAR)
-            # Convert BGR to RGB
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Convert directly to QPixmap using a more efficient method
-            try:
-                # Create QPixmap directly from numpy array - more efficient than PIL conversion
-                from PyQt6.QtGui import QImage
-                height, width, channel = frame.shape
-                bytes_per_line = 3 * width
-                q_image = QImage(frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-                pixmap = QPixmap.fromImage(q_image)
-                return pixmap
-            except Exception as photo_error:
-                print(f"🎬 ERROR creating stroop QPixmap: {photo_error}")
-                # Fallback to original method if direct conversion fails
-                try:
-                    pil_image = Image.fromarray(frame)
-                    import io
-                    buffer = io.BytesIO()
-                    pil_image.save(buffer, format='PNG')
-                    buffer.seek(0)
-                    pixmap = QPixmap()
-                    if pixmap.loadFromData(buffer.getvalue()):
-                        return pixmap
-                    else:
-                        print("🎬 ERROR: Failed to load stroop pixmap from buffer")
-                        return None
-                except Exception as fallback_error:
-                    print(f"🎬 ERROR in stroop fallback QPixmap creation: {fallback_error}")
-                    return None
+            frame = self._scaled_frame = cv2.resize(frame, (800, 450), dst=self._scaled_frame, interpolation=cv2.INTER_LINEAR)
+            return self._frame_to_pixmap(frame, "stroop ")
         except Exception as e:
             print(f"Warning: Error reading stroop video frame: {e}")
             return None
     
+    def _show_frame(self, video_widget, new_frame):
+        """Show new_frame in the widget's single frame slot, replacing the previous frame."""
+        if hasattr(video_widget, 'set_frame'):
+            video_widget.set_frame(new_frame)
+        elif hasattr(video_widget, 'setPixmap'):
+            if isinstance(new_frame, QImage):
+                new_frame = QPixmap.fromImage(new_frame)
+            video_widget.setPixmap(new_frame)
+        # Keep reference to prevent garbage collection
+        self.video_frame = new_frame
+    
     def update_video_background(self, canvas, text_item=None):
-        """Update video background for relaxation screen."""
+        """Update video background for relaxation screen.
+        
+        The frame replaces the previous one in place; the widget that shows it
+        keeps any overlaid text above it, so nothing is re-stacked per frame.
+        """
         try:
             new_frame = self.get_video_frame()
-            if new_frame and canvas:
-                # Remove old frame
-                if hasattr(self, 'video_bg_item'):
-                    canvas.delete(self.video_bg_item)
-                
-                # Add new frame as background, centered
-                # Note: This method needs to be updated for PyQt6 widgets
-                # The calling code should handle QPixmap display in PyQt6 widgets
-                self.video_bg_item = new_frame  # Store pixmap for PyQt6 usage
-                # Keep reference to prevent garbage collection
-                self.video_frame = new_frame
-                
-                # Bring text to front if it exists
-                if text_item:
-                    canvas.tag_raise(text_item)
+            if new_frame is not None and canvas:
+                self._show_frame(canvas, new_frame)
         except AttributeError:
             # Canvas or window was destroyed
             pass
@@ -235,16 +519,7 @@ class VideoManager:
         try:
             new_frame = self.get_stroop_video_frame()
             if new_frame and canvas:
-                # Remove old frame
-                canvas.delete("video_frame")
-                
-                # Add new frame
-                # Note: This method needs to be updated for PyQt6 widgets
-                # The calling code should handle QPixmap display in PyQt6 widgets
-                self.video_bg_item = new_frame  # Store pixmap for PyQt6 usage
-                
-                # Keep reference to prevent garbage collection
-                self.video_frame = new_frame
+                self._show_frame(canvas, new_frame)
         except AttributeError:
             # Canvas or window was destroyed
             pass
@@ -252,14 +527,14 @@ class VideoManager:
     def start_video_loop(self, canvas, current_screen, text_item=None):
         """Start video loop for relaxation screen."""
         print(f"🎬 Starting video loop for relaxation screen")
-        if not (hasattr(self, 'cap') and self.cap is not None):
+        if self.cap is None:
             print("🎬 ERROR: No video capture available!")
             return
         
         def update_frame():
             """Update frame in main thread using after()."""
             try:
-                if self.running and current_screen() == "relaxation" and hasattr(self, 'cap') and self.cap:
+                if self.running and current_screen() == "relaxation" and self.cap is not None:
                     self.update_video_background(canvas, text_item)
                     # Schedule next frame using PyQt6 timer (handled by calling code)
                     pass  # PyQt6 timer scheduling handled externally
@@ -275,11 +550,16 @@ class VideoManager:
         """Start video loop for PyQt6 widgets using QTimer."""
         screen_name = expected_screen or "PyQt6 widget"
         print(f"🎬 Starting PyQt6 video loop for {screen_name}")
-        if not (hasattr(self, 'cap') and self.cap is not None):
+        if self.cap is None:
             print("🎬 ERROR: No video capture available!")
             return
         
         # Create QTimer for frame updates using actual video frame rate
+        self._restart_clock()
+        if self._decoder is None:
+            self._start_decoder()  # Let the first frames decode before the first tick
+        if self.video_timer is not None:
+            self.video_timer.stop()
         self.video_timer = QTimer()
         self.video_timer.timeout.connect(
             lambda: self.update_pyqt_video_frame(video_widget, current_screen_callback, expected_screen)
@@ -291,39 +571,33 @@ class VideoManager:
     def update_pyqt_video_frame(self, video_widget, current_screen_callback, expected_screen=None):
         """Update video frame for PyQt6 widget."""
         try:
-            if (self.running and 
-                hasattr(self, 'cap') and self.cap):
-                
+            if self.running and self.cap is not None:
                 current_screen = current_screen_callback()
-                valid_screens = ["relaxation", "stroop", "post_study_rest", "poststudyrest"]
                 
                 # Allow relaxation, stroop, or post-study rest screens
                 if expected_screen:
                     should_play = (current_screen == expected_screen)
                 else:
-                    should_play = (current_screen in valid_screens)
+                    should_play = (current_screen in _VIDEO_SCREENS)
                 
                 if should_play:
                     new_frame = self.get_video_frame()
-                    if new_frame and video_widget:
-                        # Update QLabel with new pixmap
-                        if hasattr(video_widget, 'setPixmap'):
-                            video_widget.setPixmap(new_frame)
-                        elif hasattr(video_widget, 'setStyleSheet'):
-                            # For backgrounds, we might need a different approach
-                            pass
+                    if new_frame is not None and video_widget:
+                        # Update the widget with the new pixmap
+                        self._show_frame(video_widget, new_frame)
                 else:
                     # Only log the first time video is paused for a screen mismatch
-                    if not hasattr(self, '_last_pause_log') or self._last_pause_log != current_screen:
-                        print(f"🎬 Video paused - current screen: {current_screen}, expected: {expected_screen or valid_screens}")
+                    if self._last_pause_log != current_screen:
+                        dprint(f"🎬 Video paused - current screen: {current_screen}, expected: {expected_screen or list(_VIDEO_SCREENS)}")
                         self._last_pause_log = current_screen
+                    self._restart_clock()  # Don't treat the pause as lateness
             else:
                 print(f"🎬 PyQt6 video loop ended - running: {self.running}, screen: {current_screen_callback()}")
-                if hasattr(self, 'video_timer'):
+                if self.video_timer is not None:
                     self.video_timer.stop()
         except Exception as e:
             print(f"🎬 PyQt6 video loop error: {e}")
-            if hasattr(self, 'video_timer'):
+            if self.video_timer is not None:
                 self.video_timer.stop()
     
     def start_post_study_video_loop(self, canvas, current_screen, text_item=None):
@@ -333,7 +607,7 @@ class VideoManager:
         def update_frame():
             """Update frame in main thread using after()."""
             try:
-                if self.running and current_screen() == "post_study_rest" and hasattr(self, 'cap') and self.cap:
+                if self.running and current_screen() == "post_study_rest" and self.cap is not None:
                     self.update_video_background(canvas, text_item)
                     # Schedule next frame using PyQt6 timer (handled by calling code)
                     pass  # PyQt6 timer scheduling handled externally
@@ -346,22 +620,45 @@ class VideoManager:
         update_frame()
     
     def start_stroop_video_loop(self, canvas, current_screen, update_callback=None):
-        """Start stroop video playback loop."""
-        def video_loop():
-            while self.running and self.is_playing and current_screen() == "stroop":
-                try:
-                    if not self.is_paused and hasattr(self, 'cap') and self.cap:
-                        new_frame = self.get_stroop_video_frame()
-                        if new_frame and update_callback:
-                            # Update canvas with new frame
-                            update_callback(new_frame)
-                    time.sleep(1/30)  # 30 FPS
-                except AttributeError:
-                    # Window closed or object destroyed
-                    break
-        
-        thread = threading.Thread(target=video_loop, daemon=True)
-        thread.start()
+        """Start stroop video playback loop.
+        
+        Frames are produced by a QTimer on the GUI thread, so each frame is
+        decoded and handed to update_callback without a worker thread or a
+        cross-thread hop per frame.
+        """
+        self._stroop_screen_callback = current_screen
+        self._stroop_update_callback = update_callback
+        self._restart_clock()
+        if self.stroop_timer:
+            self.stroop_timer.stop()
+        self.stroop_timer = QTimer()
+        self.stroop_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.stroop_timer.timeout.connect(self._tick_stroop_frame)
+        self.stroop_timer.start(self.frame_interval_ms)
+    
+    def _tick_stroop_frame(self):
+        """Show the next stroop frame - called by the stroop timer."""
+        try:
+            if not (self.running and self.is_playing and self._stroop_screen_callback() == "stroop"):
+                self.stroop_timer.stop()
+                return
+            if self.is_paused:
+                self._restart_clock()  # Don't treat the pause as lateness
+            elif self.cap:
+                new_frame = self.get_stroop_video_frame()
+                if new_frame and self._stroop_update_callback:
+                    # Update canvas with new frame
+                    self._stroop_update_callback(new_frame)
+        except AttributeError:
+            # Window closed or object destroyed
+            self.stroop_timer.stop()
+    
+    def seek_seconds(self, seconds):
+        """Move playback to the given offset in seconds."""
+        if self.cap is None:
+            return
+        self._stop_decoder()  # Restarted from the new position on the next frame
+        self.cap.set(self._cv2.CAP_PROP_POS_FRAMES, int(seconds * self.video_fps))
     
     def toggle_video_playback(self, status_callback=None):
         """Toggle video playback in stroop screen."""
@@ -374,9 +671,7 @@ class VideoManager:
             if not self.is_playing and not self.is_paused:
                 # Start playing - set video to start at 3:00 (180 seconds)
                 self.is_playing = True
-                fps = self.cap.get(cv2.CAP_PROP_FPS)
-                frame_number = int(180 * fps)  # 180 seconds * fps
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                self.seek_seconds(180)
                 if status_callback:
                     status_callback("🎬 Playing...", '#66ff99')
                 
@@ -401,37 +696,46 @@ class VideoManager:
         if self.cap and (self.is_playing or self.is_paused):
             self.is_playing = False
             self.is_paused = False
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.seek_seconds(0)
             if status_callback:
                 status_callback("🔄 Restarted", '#66ccff')
     
     def stop_video(self):
-        """Stop video playback and release resources."""
+        """Stop video playback; the capture stays open for init_video to reuse."""
         self.running = False
         self.is_playing = False
         self.is_paused = False
         
         # Stop PyQt6 timer if it exists
-        if hasattr(self, 'video_timer'):
+        if self.video_timer is not None:
             self.video_timer.stop()
-            print("🎬 PyQt6 video timer stopped")
+            dprint("🎬 PyQt6 video timer stopped")
         
-        # Wait a moment for video threads to finish
-        time.sleep(0.1)
-
+        # Stop the stroop loop timer, which reads from the capture
+        if self.stroop_timer:
+            self.stroop_timer.stop()
+            self.stroop_timer = None
+        
+        self._stop_decoder()
+        
+        # Clear video frame reference
+        self.video_frame = None
+    
+    def _release_capture(self):
+        """Release the capture and everything kept for its clip."""
         # Clean up video capture safely
-        if hasattr(self, 'cap') and self.cap:
+        if self.cap is not None:
             try:
                 self.cap.release()
             except Exception as e:
                 print(f"Warning: Error releasing video capture: {e}")
             finally:
                 self.cap = None
-        
-        # Clear video frame reference
-        if hasattr(self, 'video_frame'):
-            self.video_frame = None
+        self._video_path = None
+        self._raw_frame = None
+        self._scaled_frame = None
     
     def cleanup(self):
         """Clean up video resources."""
-        self.stop_video()
\ No newline at end of file
+        self.stop_video()
+        self._release_capture()
\ No newline at end of file
@@ -118,7 +118,9 @@ def analyze_actions(participant_id):
     if sentences:
         print(f"\nSentence Completions ({len(sentences)}):")
         for sentence in sentences:
-            details = json.loads(sentence['details'])
+            details = sentence['details']
+            if isinstance(details, str):
+                details = json.loads(details)  # Older logs
             print(f"  {sentence['timestamp']['local']}: \"{details['sentence']}\"")
 
 def analyze_responses(participant_id):
@@ -102,11 +102,11 @@ def create_session_with_partial_text():
         },
         "participant_id": participant_id,
         "action_type": "COUNTDOWN_STATE",
-        "details": json.dumps({
+        "details": {
             "remaining_seconds": 180,
             "total_seconds": 300,
-            "percentage_complete": 40.0
-        }),
+            "percentage_complete": 40
+        },
         "screen": "descriptive_task",
         "session_duration_seconds": 36.0
     })
@@ -29,7 +29,9 @@ def debug_countdown_values():
                     entry = json.loads(line)
                     
                     if entry.get('action_type') == 'COUNTDOWN_STATE':
-                        details = json.loads(entry.get('details', '{}'))
+                        details = entry.get('details', {})
+                        if isinstance(details, str):
+                            details = json.loads(details)  # Older logs
                         remaining = details.get('remaining_seconds', 0)
                         total = details.get('total_seconds', 0)
                         countdown_values.append({